@@ -9,14 +9,113 @@
 
 import argparse
 import ast
+import fnmatch
+import hashlib
 import json
 import os
-from pathlib import Path
-from typing import Literal
+import pickle
+import re
+import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path, PurePath
+from typing import Any, Literal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 AstType = Literal['classes', 'functions', 'imports', 'methods']
 """Type alias for AST types to extract from code files."""
 
+CACHE_VERSION = 2
+"""The AST cache format version, to bump when the parsed output changes."""
+
+
+def _parse_file_content(
+    generator: 'KnowledgeGenerator', content: bytes
+) -> dict | None:
+    """Parse a file content, returning `None` on syntax errors.
+
+    Defined at module level so it can be dispatched to worker processes.
+    """
+    try:
+        return generator._parse_content(content)
+    except SyntaxError:
+        return None
+
+
+class _ContentCollector(ast.NodeVisitor):
+    """Collect classes, functions, and imports in a single AST pass.
+
+    Classes and functions are only collected at module scope, with class
+    methods gathered from the class body. Imports are collected at any depth.
+    """
+
+    def __init__(self, generator: 'KnowledgeGenerator'):
+        self.generator = generator
+        self.content_docstring = generator.content_docstring
+        self.content_classes = 'classes' in generator.content_types
+        self.content_functions = 'functions' in generator.content_types
+        self.content_imports = 'imports' in generator.content_types
+        self.content_methods = 'methods' in generator.content_types
+        self.classes: dict[str, dict] = {}
+        self.functions: dict[str, dict] = {}
+        self.imports: list[str] = []
+        self._depth = 0
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        if self._depth == 0 and self.content_classes:
+            self._collect_class(node)
+        self._visit_nested(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        if self._depth == 0 and self.content_functions:
+            if self.generator._check_name(node.name):
+                self.functions[node.name] = self._function_info(node)
+        self._visit_nested(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        if self.content_imports:
+            self.imports.append(ast.unparse(node))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if self.content_imports:
+            self.imports.append(ast.unparse(node))
+
+    def _visit_nested(self, node: ast.AST) -> None:
+        # Nested scopes are only relevant when collecting imports
+        if not self.content_imports:
+            return
+        self._depth += 1
+        self.generic_visit(node)
+        self._depth -= 1
+
+    def _collect_class(self, node: ast.ClassDef) -> None:
+        check_name = self.generator._check_name
+        if not check_name(node.name):
+            return
+        self.classes[node.name] = cls_info = {}
+        if self.content_docstring:
+            cls_info['docstring'] = self.generator._extract_docstring(node)
+        if self.content_methods:
+            cls_info['methods'] = methods = {}
+            for item in node.body:
+                if not isinstance(item, ast.FunctionDef):
+                    continue
+                if not check_name(item.name):
+                    continue
+                methods[item.name] = self._function_info(item)
+
+    def _function_info(self, node: ast.FunctionDef) -> dict:
+        info = {}
+        if self.content_docstring:
+            info['docstring'] = self.generator._extract_docstring(node)
+        info['signature'] = self.generator._extract_signature(node)
+        return info
+
 
 class KnowledgeGenerator:
     """Generate code knowledge for AI agent."""
@@ -30,9 +129,11 @@ class KnowledgeGenerator:
         exclude_patterns: list[str] | None = None,
         content_docstring: bool = True,
         content_internal: bool = True,
-        content_types: set[AstType] | None = None,
+        content_types: Iterable[AstType] | None = None,
         max_chars: int | None = None,
         max_files: int | None = None,
+        use_cache: bool = True,
+        max_workers: int | None = None,
     ):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(os.getcwd()) / output_dir
@@ -40,90 +141,234 @@ class KnowledgeGenerator:
         self.exclude_patterns = exclude_patterns or [
             '*__pycache__*', '*test*', '*.pyc', '*.git*'
         ]
+        self.include_regex, self.include_paths = \
+            self._compile_patterns(self.include_patterns)
+        self.exclude_regex, self.exclude_paths = \
+            self._compile_patterns(self.exclude_patterns)
         self.content_docstring = content_docstring
         self.content_internal = content_internal
-        self.content_types = content_types or {
+        self.content_types = frozenset(content_types or (
             'classes', 'functions', 'imports', 'methods'
-        }
+        ))
         self.max_chars = max_chars
         self.max_files = max_files
+        self.use_cache = use_cache
+        self.cache_dir = self.output_dir / '.ast_cache'
+        self.max_workers = max_workers
         self.processed_files = 0
 
-    def build_knowledge(self) -> dict[str, str]:
-        """Build code knowledge from input directory files."""
-        knowledge = {}
+    def build_knowledge(
+        self, files: list[str] | None = None
+    ) -> dict[str, str]:
+        """Build code knowledge from input directory files.
 
-        # Walk through input directory Python files
-        for file in self.input_dir.rglob('*.py'):
-            if self.max_files and self.processed_files >= self.max_files:
-                print(f"Reached maximum file limit ({self.max_files})")
-                break
-            if not self._check_path(file):
-                continue
+        Cached contents are resolved in-process, while cache misses are parsed
+        in parallel across worker processes.
 
-            relative_path = file.relative_to(self.input_dir)
+        Args:
+            files: The input directory files to process. When not provided,
+                the input directory is scanned for included files.
+        """
+        # Walk through input directory Python files
+        if files is None:
+            _, files = self._scan()
+        if self.max_files and len(files) > self.max_files:
+            print(f"Reached maximum file limit ({self.max_files})")
+            files = files[:self.max_files]
+
+        # Resolve file contents from cache, files sharing the same source
+        # content and options being resolved only once.
+        keys: dict[str, str] = {}
+        results: dict[str, dict | None] = {}
+        pending: dict[str, bytes] = {}
+        for file in files:
             try:
-                with open(file, 'r', encoding='utf-8') as f:
+                with open(file, 'rb') as f:
                     content = f.read()
-                    try:
-                        processed_content = self._parse_content(content)
-                        if processed_content:
-                            knowledge[str(relative_path)] = processed_content
-                            self.processed_files += 1
-                    except SyntaxError:
-                        print(f"Warning: Could not parse {file}")
             except Exception as error:
                 print(f"Error processing {file}: {error}")
+                continue
+            keys[file] = key = self._cache_key(content)
+            if key in results or key in pending:
+                continue
+            processed_content = self._load_cache(key)
+            if processed_content is None:
+                pending[key] = content
+            else:
+                results[key] = processed_content
+
+        # Parse missing file contents
+        contents = list(pending.values())
+        if len(contents) > 1 and self.max_workers != 1:
+            with ProcessPoolExecutor(self.max_workers) as executor:
+                parsed = list(executor.map(
+                    partial(_parse_file_content, self), contents, chunksize=16
+                ))
+        else:
+            parsed = [_parse_file_content(self, c) for c in contents]
+        for key, processed_content in zip(pending, parsed):
+            results[key] = processed_content
+            if processed_content is not None:
+                self._save_cache(key, processed_content)
+
+        knowledge = {}
+        input_dir = str(self.input_dir)
+        for file, key in keys.items():
+            processed_content = results[key]
+            if processed_content is None:
+                print(f"Warning: Could not parse {file}")
+                continue
+            if processed_content:
+                relative_path = os.path.relpath(file, input_dir)
+                knowledge[relative_path] = processed_content
+                self.processed_files += 1
 
         return knowledge
 
     def build_tree_view(self) -> dict:
         """Build tree view from input directory files."""
-
-        def walk_tree(path: Path) -> dict:
-            tree = {}
-            for item in path.iterdir():
-                if item.is_file():
-                    if not self._check_path(item):
-                        continue
-                    tree[item.name] = None
-                else:
-                    tree_node = walk_tree(item)
-                    if not tree_node:
-                        continue
-                    tree[item.name] = tree_node
-            return tree
-
-        return walk_tree(self.input_dir)
+        tree, _ = self._scan()
+        return tree
 
     def export(self):
         """Export generated knowledge and tree to JSON files."""
         self.output_dir.mkdir(exist_ok=True)
 
-        knowledge = self.build_knowledge()
-        with open(self.output_dir / 'agent_knowledge.json', 'w') as f:
-            json.dump(knowledge, f, indent=2)
+        tree, files = self._scan()
 
-        tree = self.build_tree_view()
-        with open(self.output_dir / 'agent_tree.json', 'w') as f:
-            json.dump(tree, f, indent=2)
+        knowledge = self.build_knowledge(files)
+        self._write_json(self.output_dir / 'agent_knowledge.json', knowledge)
+        self._write_json(self.output_dir / 'agent_tree.json', tree)
 
         print(f"\nGenerated files in {self.output_dir}:")
         print(f"- agent_knowledge.json")
         print(f"- agent_tree.json")
         print(f"\nProcessed {self.processed_files} files")
 
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """Write data as indented JSON, using `orjson` when available."""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
+        else:
+            with open(path, 'w') as f:
+                f.write(json.dumps(data, indent=2))
+
+    def _cache_key(self, content: bytes) -> str:
+        """Compute the cache key of a code content and generator options.
+
+        The key accounts for the source content, the Python version used to
+        parse it, and every option affecting the parsed output, so that a
+        cached entry is only reused when it would be identical.
+        """
+        options = repr((
+            CACHE_VERSION,
+            self.content_docstring,
+            self.content_internal,
+            sorted(self.content_types),
+            self.max_chars,
+        ))
+        digest = hashlib.blake2b(content, digest_size=16)
+        digest.update(options.encode())
+        return digest.hexdigest()
+
+    def _load_cache(self, key: str) -> dict | None:
+        """Load parsed content from the AST cache if available."""
+        if not self.use_cache:
+            return None
+        cache_file = self.cache_dir / f'{key}.pkl'
+        try:
+            with open(cache_file, 'rb') as f:
+                version, parts = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        if version != tuple(sys.version_info):
+            return None
+        return parts  # type: ignore[no-any-return]
+
+    def _save_cache(self, key: str, parts: dict) -> None:
+        """Save parsed content to the AST cache."""
+        if not self.use_cache:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = self.cache_dir / f'{key}.pkl'
+        with open(cache_file, 'wb') as f:
+            pickle.dump((tuple(sys.version_info), parts), f)
+
     def _check_name(self, name: str) -> bool:
         """Whether to include a name based on internal content setting."""
         return self.content_internal or not name.startswith('_')
 
-    def _check_path(self, path: Path) -> bool:
-        """Whether to include a path based on include/exclude patterns."""
+    def _check_dir(self, name: str) -> bool:
+        """Whether to walk a directory name based on exclude patterns."""
+        return not self.exclude_regex.match(name)
+
+    def _check_path(self, name: str, path: str) -> bool:
+        """Whether to include a file based on include/exclude patterns.
+
+        Single component patterns are matched against the file name, and
+        multiple components patterns against the file path relative to the
+        input directory, from the right like `Path.match`.
+        """
+        def match(regex: re.Pattern[str], patterns: list[str]) -> bool:
+            if regex.match(name):
+                return True
+            if not patterns:
+                return False
+            relative_path = PurePath(os.path.relpath(path, self.input_dir))
+            return any(relative_path.match(p) for p in patterns)
+
         return (
-            not any(path.match(p) for p in self.exclude_patterns)
-            and any(path.match(p) for p in self.include_patterns)
+            not match(self.exclude_regex, self.exclude_paths)
+            and match(self.include_regex, self.include_paths)
         )
 
+    def _scan(self) -> tuple[dict, list[str]]:
+        """Scan the input directory tree and included files in one pass.
+
+        Excluded directories are pruned from the walk. Directories without any
+        included file are omitted from the tree view. The walk operates on
+        plain string paths, and included Python files are returned as such
+        for parsing.
+        """
+        files: list[str] = []
+
+        def walk_tree(path: str) -> dict:
+            tree = {}
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._check_dir(entry.name):
+                            continue
+                        tree_node = walk_tree(entry.path)
+                        if not tree_node:
+                            continue
+                        tree[entry.name] = tree_node
+                    elif self._check_path(entry.name, entry.path):
+                        tree[entry.name] = None
+                        if entry.name.endswith('.py'):
+                            files.append(entry.path)
+            return tree
+
+        return walk_tree(str(self.input_dir)), files
+
+    @staticmethod
+    def _compile_patterns(
+        patterns: list[str],
+    ) -> tuple[re.Pattern[str], list[str]]:
+        """Compile glob patterns into a single name matching regex.
+
+        Patterns with multiple path components cannot be matched against a
+        name and are returned apart to be matched against file paths.
+        """
+        names = [p for p in patterns if '/' not in p]
+        paths = [p for p in patterns if '/' in p]
+        if not names:
+            return re.compile(r'(?!)'), paths
+        return re.compile('|'.join(fnmatch.translate(p) for p in names)), paths
+
     def _extract_docstring(self, node: ast.AST) -> str | None:
         """Extract docstring from AST node."""
         docstring = ast.get_docstring(node)
@@ -132,67 +377,41 @@ class KnowledgeGenerator:
         return docstring
 
     def _extract_signature(self, node: ast.FunctionDef) -> str:
-        """Extract function signature from AST node."""
-        args = []
-        for arg in node.args.args:
-            arg_str = arg.arg
-            if arg.annotation:
-                arg_str += f": {ast.unparse(arg.annotation)}"
-            args.append(arg_str)
-
-        signature = f"def {node.name}({', '.join(args)})"
+        """Extract function signature from AST node.
+
+        The signature includes positional-only, variadic, and keyword-only
+        arguments with their annotations and default values.
+        """
+        signature = f"def {node.name}({ast.unparse(node.args)})"
         if node.returns:
             signature += f" -> {ast.unparse(node.returns)}"
         return signature
 
-    def _parse_content(self, content: str) -> dict:
-        """Parse code content and extract relevant parts."""
-        code = ast.parse(content)
+    def _parse_content(self, content: bytes) -> dict:
+        """Parse code content and extract relevant parts.
+
+        The raw source bytes are handed to the parser, which resolves the
+        source encoding itself, so no intermediate decoding is needed.
+        """
+        code = ast.parse(content, type_comments=False)
         parts = {}
 
         if self.content_docstring:
             parts['docstring'] = self._extract_docstring(code)
 
-        if 'classes' in self.content_types:
-            parts['classes'] = {}
-            for node in ast.walk(code):
-                if not isinstance(node, ast.ClassDef):
-                    continue
-                if not self._check_name(node.name):
-                    continue
-                parts['classes'][node.name] = cls_info = {}
-                if self.content_docstring:
-                    cls_info['docstring'] = self._extract_docstring(node)
-                if 'methods' in self.content_types:
-                    cls_info['methods'] = {}
-                    for item in node.body:
-                        if not isinstance(item, ast.FunctionDef):
-                            continue
-                        if not self._check_name(item.name):
-                            continue
-                        cls_info['methods'][item.name] = info = {}
-                        if self.content_docstring:
-                            info['docstring'] = self._extract_docstring(item)
-                        info['signature'] = self._extract_signature(item)
-
-        if 'functions' in self.content_types:
-            parts['functions'] = {}
-            for node in ast.walk(code):
-                if not isinstance(node, ast.FunctionDef):
-                    continue
-                if not self._check_name(node.name):
-                    continue
-                parts['functions'][node.name] = fn_info = {}
-                if self.content_docstring:
-                    fn_info['docstring'] = self._extract_docstring(node)
-                fn_info['signature'] = self._extract_signature(node)
-
-        if 'imports' in self.content_types:
-            parts['imports'] = []
-            for node in ast.walk(code):
-                if not isinstance(node, (ast.Import, ast.ImportFrom)):
-                    continue
-                parts['imports'].append(ast.unparse(node))
+        # Skip the AST traversal when no node content is requested
+        if not self.content_types & {'classes', 'functions', 'imports'}:
+            return parts
+
+        collector = _ContentCollector(self)
+        collector.visit(code)
+
+        if collector.content_classes:
+            parts['classes'] = collector.classes
+        if collector.content_functions:
+            parts['functions'] = collector.functions
+        if collector.content_imports:
+            parts['imports'] = collector.imports
 
         return parts
 
@@ -249,6 +468,16 @@ def main():
         type=int,
         help='Maximum number of files to process',
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Maximum number of worker processes used to parse files',
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk AST cache',
+    )
 
     args = parser.parse_args()
 
@@ -262,6 +491,8 @@ def main():
         content_types=set(args.types),
         max_chars=args.max_chars,
         max_files=args.max_files,
+        use_cache=not args.no_cache,
+        max_workers=args.workers,
     )
 
     generator.export()
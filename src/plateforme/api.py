@@ -13,6 +13,8 @@ data structures management, and custom request and response handling.
 """
 
 from .core.api.authentication import (
+    EMPTY_CREDENTIALS,
+    GUEST_USER,
     AuthClaim,
     AuthCredentials,
     AuthUser,
@@ -85,6 +87,8 @@ __all__ = (
     'AuthUser',
     'GuestUser',
     'requires',
+    'EMPTY_CREDENTIALS',
+    'GUEST_USER',
     # Background
     'BackgroundTasks',
     # Base
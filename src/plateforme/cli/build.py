@@ -36,6 +36,9 @@ def build(ctx: Context) -> None:
         logger.error("No scripts found")
         raise typer.Exit(code=1)
 
+    env = os.environ.copy()
+    env['PYTHONPATH'] = project.directory
+
     for script in config.build:
         command = config.scripts[script].split()
         if not command:
@@ -47,10 +50,7 @@ def build(ctx: Context) -> None:
                 command,
                 check=True,
                 cwd=project.directory,
-                env={
-                    **os.environ,
-                    "PYTHONPATH": project.directory,
-                },
+                env=env,
             )
         except subprocess.CalledProcessError:
             logger.error(f"An error occurred while running script {script!r}")
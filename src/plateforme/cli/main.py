@@ -10,44 +10,56 @@ The main command line interface entry point.
 """
 
 import sys
+from importlib import import_module
 
+import click
 import typer
+from typer.core import TyperGroup
 
-from plateforme.core.projects import import_project_info
-
-from . import (
-    build,
-    clean,
-    deploy,
-    drop,
-    init,
-    inspect,
-    install,
-    migrate,
-    publish,
-    run,
-    shell,
-    start,
-)
-from .utils.config import mount
 from .utils.context import Context, ContextInfo
 from .utils.info import print_info
 from .utils.logging import logger
 
-app = typer.Typer()
+COMMANDS = (
+    'build',
+    'clean',
+    'deploy',
+    'drop',
+    'init',
+    'inspect',
+    'install',
+    'migrate',
+    'publish',
+    'run',
+    'shell',
+    'start',
+)
+"""The command line interface subcommand module names."""
+
+
+class LazyGroup(TyperGroup):
+    """A command group that imports its subcommand modules on demand.
+
+    Each subcommand is defined in its own module within this package, whose
+    Typer application is only imported and converted into a click command
+    when the subcommand is resolved, e.g. when invoked or listed for help.
+    """
 
-mount(app, build.app, merge=True)
-mount(app, clean.app, merge=True)
-mount(app, deploy.app, merge=True)
-mount(app, drop.app, merge=True)
-mount(app, init.app, merge=True)
-mount(app, inspect.app, merge=True)
-mount(app, install.app, merge=True)
-mount(app, migrate.app, merge=True)
-mount(app, publish.app, merge=True)
-mount(app, run.app, merge=True)
-mount(app, shell.app, merge=True)
-mount(app, start.app, merge=True)
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*super().list_commands(ctx), *COMMANDS]
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> click.Command | None:
+        if cmd_name not in COMMANDS:
+            return super().get_command(ctx, cmd_name)
+        module = import_module(f'.{cmd_name}', __package__)
+        command = typer.main.get_command(module.app)
+        command.name = cmd_name
+        return command
+
+
+app = typer.Typer(cls=LazyGroup)
 
 
 @app.callback()
@@ -75,6 +87,8 @@ def main(
     ),
 ) -> None:
     """Command line interface main entry point."""
+    from plateforme.core.projects import import_project_info
+
     # Print information
     print_info(ctx)
 
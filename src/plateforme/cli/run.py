@@ -40,15 +40,15 @@ def run(
         logger.error(f"Empty script command for {script!r}")
         raise typer.Exit(code=1)
 
+    env = os.environ.copy()
+    env['PYTHONPATH'] = project.directory
+
     try:
         subprocess.run(
             command,
             check=True,
             cwd=project.directory,
-            env={
-                **os.environ,
-                "PYTHONPATH": project.directory,
-            },
+            env=env,
         )
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to run script {script!r}")
@@ -58,15 +58,15 @@ def start(
     command = ['uvicorn', *config.start.split()]
     command.extend(nargs or [])
 
+    env = os.environ.copy()
+    env['PYTHONPATH'] = project.directory
+
     try:
         subprocess.run(
             command,
             check=True,
             cwd=project.directory,
-            env={
-                **os.environ,
-                "PYTHONPATH": project.directory,
-            },
+            env=env,
         )
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to start application {project_app!r}")
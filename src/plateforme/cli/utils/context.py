@@ -10,18 +10,20 @@ Context utilities for the command line interface.
 """
 
 import dataclasses
+import typing
 
 import typer
 
-from plateforme.core.projects import ProjectAppInfo, ProjectInfo
-
 from .logging import logger
 
+if typing.TYPE_CHECKING:
+    from plateforme.core.projects import ProjectAppInfo, ProjectInfo
+
 
 @dataclasses.dataclass(kw_only=True, slots=True)
 class ContextInfo:
     """Context information for the command line interface."""
-    project: ProjectInfo | None
+    project: 'ProjectInfo | None'
     project_app: str | None
 
     def __post_init__(self) -> None:
@@ -43,7 +45,7 @@ class ContextInfo:
             logger.error("Cannot specify an application without a project")
             raise typer.Exit(code=1)
 
-    def get_app_config(self) -> tuple[ProjectAppInfo, ProjectInfo, str]:
+    def get_app_config(self) -> tuple['ProjectAppInfo', 'ProjectInfo', str]:
         """Get the project application configuration."""
         if self.project is None:
             logger.error("No project found")
@@ -11,13 +11,16 @@ Plateforme framework's API using FastAPI and Starlette features.
 """
 
 import dataclasses
+import sys
 from abc import ABC, abstractmethod
-from typing import Annotated, Any
+from collections.abc import Iterable
+from typing import Annotated, Any, ClassVar
 
 from starlette.authentication import requires
 from typing_extensions import override
 
 from ..schema.aliases import AliasChoices
+from ..schema.decorators import field_validator
 from ..schema.fields import Field
 from ..schema.models import BaseModel
 
@@ -28,6 +31,8 @@ __all__ = (
     'AuthUser',
     'GuestUser',
     'requires',
+    'EMPTY_CREDENTIALS',
+    'GUEST_USER',
 )
 
 
@@ -43,6 +48,9 @@ class AuthClaim(BaseModel, extra='allow', frozen=True):
         https://www.rfc-editor.org/rfc/rfc7519
     """
 
+    __claim_fields__: ClassVar[dict[bool, dict[str, str]]]
+    """The claim field serialization aliases indexed by secure flag."""
+
     issuer: Annotated[str | None, 'secure'] = Field(
         default=None,
         validation_alias=AliasChoices('iss', 'issuer'),
@@ -132,12 +140,20 @@ class AuthClaim(BaseModel, extra='allow', frozen=True):
         max_length=255,
     )
 
-    roles: list[str] | None = Field(
+    roles: tuple[str, ...] | None = Field(
         default=None,
         title='Roles',
         description='The roles assigned to the principal.',
     )
 
+    @field_validator('roles', mode='after')
+    @classmethod
+    def __roles_validator__(
+        cls, value: tuple[str, ...] | None
+    ) -> tuple[str, ...] | None:
+        # Intern role names shared across claims
+        return _intern_roles(value)
+
     @property
     def scopes(self) -> list[str]:
         """The permission scopes of the token."""
@@ -164,32 +180,73 @@ class AuthClaim(BaseModel, extra='allow', frozen=True):
         if secure is None:
             return super().model_dump(**kwargs)
         # Dump all fields and filter by secure flag
+        by_alias = kwargs.pop('by_alias', False)
         result_dump = super().model_dump(**kwargs, by_alias=False)
-        result = {}
-        for field_name, field_value in result_dump.items():
-            if field_name in self.model_fields:
-                field_info = self.model_fields[field_name]
-                if secure != ('secure' in field_info.metadata):
-                    continue
-            elif not secure and field_name in self.model_computed_fields:
-                field_info = \
-                    self.model_computed_fields[field_name]  # type: ignore
-            else:
-                continue
-            if 'by_alias' in kwargs:
-                result[field_info.alias] = field_value
-            else:
-                result[field_name] = field_value
-        return result
+        fields = self.__claim_fields__[secure]
+        if by_alias:
+            return {
+                fields[name]: value
+                for name, value in result_dump.items() if name in fields
+            }
+        return {
+            name: value
+            for name, value in result_dump.items() if name in fields
+        }
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _index_claim_fields(cls)
+
+
+def _index_claim_fields(cls: type[AuthClaim]) -> None:
+    """Index the claim fields serialization aliases by secure flag.
+
+    Both model fields and computed fields are indexed, so that dumping a
+    claim filters each field with a single membership test.
+    """
+    cls.__claim_fields__ = {True: {}, False: {}}
+    for name, field in cls.model_fields.items():
+        alias = field.serialization_alias or field.alias or name
+        cls.__claim_fields__['secure' in field.metadata][name] = alias
+    # Computed fields are never secure
+    for name, computed in cls.model_computed_fields.items():
+        cls.__claim_fields__[False][name] = computed.alias or name
+
+
+_index_claim_fields(AuthClaim)
+
+
+def _intern_roles(roles: Iterable[str] | None) -> tuple[str, ...] | None:
+    """Intern role names into a tuple, so that identical role names share a
+    single string object and compare by identity first."""
+    if roles is None:
+        return None
+    return tuple(sys.intern(role) for role in roles)
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class AuthCredentials:
     """A user credentials for the authentication middleware."""
 
-    scopes: list[str] = dataclasses.field(default_factory=list)
+    scopes: frozenset[str] = frozenset()
     """The scopes of the authentication credentials."""
 
+    def __post_init__(self) -> None:
+        # Coerce scopes provided as any other iterable
+        if not isinstance(self.scopes, frozenset):
+            object.__setattr__(self, 'scopes', frozenset(self.scopes))
+
+    @classmethod
+    def from_claim(cls, claim: AuthClaim) -> 'AuthCredentials':
+        """Create authentication credentials from an authentication claim.
+
+        Claims without any scope share the `EMPTY_CREDENTIALS` instance.
+        """
+        if not claim.scopes:
+            return EMPTY_CREDENTIALS
+        return cls(scopes=frozenset(claim.scopes))
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class BaseUser(ABC):
@@ -213,9 +270,13 @@ class AuthUser(BaseUser):
     username: str
     """The username of the authenticated user."""
 
-    roles: list[str] | None = dataclasses.field(default=None, kw_only=True)
+    roles: tuple[str, ...] | None = \
+        dataclasses.field(default=None, kw_only=True)
     """The roles of the authenticated user."""
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'roles', _intern_roles(self.roles))
+
     @property
     def is_authenticated(self) -> bool:
         return True
@@ -236,3 +297,11 @@ class GuestUser(BaseUser):
     @property
     def display_name(self) -> str:
         return ''
+
+
+EMPTY_CREDENTIALS = AuthCredentials()
+"""The shared empty authentication credentials."""
+
+
+GUEST_USER = GuestUser()
+"""The shared guest user for unauthenticated connections."""
@@ -11,8 +11,8 @@ Plateforme framework's API using FastAPI and Starlette features.
 """
 
 import dataclasses
+import typing
 
-from fastapi.datastructures import UploadFile
 from starlette.datastructures import (
     URL,
     Address,
@@ -24,6 +24,9 @@ from starlette.datastructures import (
     URLPath,
 )
 
+if typing.TYPE_CHECKING:
+    from fastapi.datastructures import UploadFile
+
 __all__ = (
     'Address',
     'FormData',
@@ -38,6 +41,14 @@ __all__ = (
 )
 
 
+JWT_MIN_LENGTH = 20
+"""The minimum length of a JSON Web Token (JWT) string."""
+
+
+JWT_MAX_LENGTH = 8192
+"""The maximum length of a JSON Web Token (JWT) string."""
+
+
 @dataclasses.dataclass(frozen=True, slots=True)
 class JWT:
     """A data structure representing a JSON Web Token (JWT)."""
@@ -53,15 +64,45 @@ class JWT:
 
     def __init__(self, token: str) -> None:
         """Split a JWT token into its header, payload, and signature parts."""
-        parts = token.split('.')
-        if len(parts) != 3:
+        # Reject tokens of invalid length before scanning them
+        if not JWT_MIN_LENGTH <= len(token) <= JWT_MAX_LENGTH:
+            raise ValueError('Invalid JWT token format')
+        # Locate the two part separators without splitting the token
+        i = token.find('.')
+        j = token.find('.', i + 1)
+        if i < 0 or j < 0 or token.find('.', j + 1) >= 0:
             raise ValueError('Invalid JWT token format')
-        object.__setattr__(self, 'header', parts[0])
-        object.__setattr__(self, 'payload', parts[1])
-        object.__setattr__(self, 'signature', parts[2])
+        object.__setattr__(self, 'header', token[:i])
+        object.__setattr__(self, 'payload', token[i + 1:j])
+        object.__setattr__(self, 'signature', token[j + 1:])
 
     def __repr__(self) -> str:
         return "JWT('**********')"
 
     def __str__(self) -> str:
         return '**********'
+
+
+# MARK: Dynamic Imports
+
+__all_dynamic__: dict[str, str] = {
+    'UploadFile': 'fastapi.datastructures',
+}
+"""The data structures only provided by FastAPI, imported on first access to
+avoid loading the FastAPI package when importing this module."""
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all_dynamic__:
+        raise AttributeError(f"Module {__name__!r} has no attribute {name!r}.")
+
+    from importlib import import_module
+
+    module = import_module(__all_dynamic__[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
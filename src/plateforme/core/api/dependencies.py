@@ -11,6 +11,7 @@ framework.
 """
 
 from collections.abc import AsyncGenerator, Generator
+from functools import partial
 from typing import Annotated
 
 from ..database.sessions import (
@@ -34,15 +35,19 @@ __all__ = (
 
 # MARK: Function Dependencies
 
+_async_session_manager = partial(async_session_manager, on_missing='raise')
+_session_manager = partial(session_manager, on_missing='raise')
+
+
 async def async_session_dependency() -> AsyncGenerator[AsyncSession, None]:
     """Get an async database session dependency."""
-    async with async_session_manager(on_missing='raise') as session:
+    async with _async_session_manager() as session:
         yield session
 
 
 def session_dependency() -> Generator[Session, None, None]:
     """Get a database session dependency."""
-    with session_manager(on_missing='raise') as session:
+    with _session_manager() as session:
         yield session
 
 
@@ -50,27 +55,33 @@ def filter_dependency(
     request: Request, filter: Filter | None = None
 ) -> Filter | None:
     """Get a filter query parameters injection dependency."""
-    criteria = {}
-    for key, value in request.query_params.items():
-        # Skip non-filter parameters
-        if not key.startswith('.'):
-            continue
-        criteria[key[1:]] = value
+    # Collect filter parameters, i.e. prefixed with a dot
+    criteria = {
+        key[1:]: value
+        for key, value in request.query_params.multi_items()
+        if key[:1] == '.'
+    }
 
     if not criteria:
         return filter
-    return Filter(filter or {}, **criteria)
+    return Filter.from_criteria(filter or {}, update=criteria)
 
 
 # MARK: Type Dependencies
 
-AsyncSessionDep = Annotated[AsyncSession, Depends(async_session_dependency)]
+AsyncSessionDep = Annotated[
+    AsyncSession, Depends(async_session_dependency, use_cache=True)
+]
 """An async database session dependency."""
 
 
-SessionDep = Annotated[Session, Depends(session_dependency)]
+SessionDep = Annotated[
+    Session, Depends(session_dependency, use_cache=True)
+]
 """A database session dependency."""
 
 
-FilterDep = Annotated[Filter | None, Depends(filter_dependency)]
+FilterDep = Annotated[
+    Filter | None, Depends(filter_dependency, use_cache=True)
+]
 """A filter query parameters injection dependency."""
@@ -14,7 +14,7 @@ from fastapi.exceptions import HTTPException, WebSocketException
 
 from .. import errors
 from .requests import Request
-from .responses import JSONResponse
+from .responses import JSONResponse, Response
 from .status import status
 from .types import ExceptionHandler
 
@@ -29,15 +29,20 @@ __all__ = (
 
 # MARK: Database Handlers
 
+DATABASE_ERROR_CONTENT = JSONResponse(
+    content={'message': "An error occurred within a database operation."},
+).body
+"""The pre-rendered content of database exception responses."""
+
+
 def database_exception_handler(
     request: Request, exc: Exception
-) -> JSONResponse:
+) -> Response:
     """Handle database exceptions."""
-    return JSONResponse(
+    return Response(
+        content=DATABASE_ERROR_CONTENT,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            'message': "An error occurred within a database operation."
-        },
+        media_type='application/json',
     )
 
 
@@ -10,18 +10,21 @@ This module provides utilities for managing responses within the Plateforme
 framework's API using FastAPI and Starlette features.
 """
 
-from fastapi.responses import (
+import typing
+
+from starlette.responses import (
     FileResponse,
     HTMLResponse,
     JSONResponse,
-    ORJSONResponse,
     PlainTextResponse,
     RedirectResponse,
     Response,
     StreamingResponse,
-    UJSONResponse,
 )
 
+if typing.TYPE_CHECKING:
+    from fastapi.responses import ORJSONResponse, UJSONResponse
+
 __all__ = (
     'FileResponse',
     'HTMLResponse',
@@ -33,3 +36,29 @@ __all__ = (
     'StreamingResponse',
     'UJSONResponse',
 )
+
+
+# MARK: Dynamic Imports
+
+__all_dynamic__: dict[str, str] = {
+    'ORJSONResponse': 'fastapi.responses',
+    'UJSONResponse': 'fastapi.responses',
+}
+"""The responses only provided by FastAPI, imported on first access to avoid
+loading the FastAPI package when importing this module."""
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all_dynamic__:
+        raise AttributeError(f"Module {__name__!r} has no attribute {name!r}.")
+
+    from importlib import import_module
+
+    module = import_module(__all_dynamic__[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -10,30 +10,35 @@ This module provides utilities for managing security within the Plateforme
 framework's API using FastAPI and Starlette features.
 """
 
+import dataclasses
+import typing
 from enum import StrEnum
-from typing import Annotated, Literal, Union
-
-from fastapi.security import (
-    APIKeyCookie,
-    APIKeyHeader,
-    APIKeyQuery,
-    HTTPAuthorizationCredentials,
-    HTTPBasic,
-    HTTPBasicCredentials,
-    HTTPBearer,
-    HTTPDigest,
-    OAuth2,
-    OAuth2AuthorizationCodeBearer,
-    OAuth2PasswordBearer,
-    OpenIdConnect,
-    SecurityScopes,
-)
+from functools import lru_cache
+from typing import Annotated, Any, Literal, Union
 
-from ..schema.types import Discriminator
+from ..schema.types import Discriminator, TypeAdapter
 from ..types.networks import HttpUrl
 from ..types.secrets import SecretStr
 from .parameters import Form
 
+if typing.TYPE_CHECKING:
+    from fastapi.dependencies.models import Dependant
+    from fastapi.security import (
+        APIKeyCookie,
+        APIKeyHeader,
+        APIKeyQuery,
+        HTTPAuthorizationCredentials,
+        HTTPBasic,
+        HTTPBasicCredentials,
+        HTTPBearer,
+        HTTPDigest,
+        OAuth2,
+        OAuth2AuthorizationCodeBearer,
+        OAuth2PasswordBearer,
+        OpenIdConnect,
+        SecurityScopes,
+    )
+
 __all__ = (
     # API
     'APIKeyCookie',
@@ -67,19 +72,78 @@ __all__ = (
     'OAuth2ResponseType',
     'OAuth2RevocationType',
     'OAuth2TokenType',
+    'OAuth2Type',
+    # OAuth2 (validation)
+    'get_request_form_dependant',
+    'validate_authorize_request_form',
+    'validate_token_request_form',
     # Miscellaneous
     'OpenIdConnect',
     'SecurityScopes',
 )
 
 
-class OAuth2ClientType(StrEnum):
+# MARK: Dynamic Imports
+
+__all_dynamic__: dict[str, str] = {
+    'APIKeyCookie': 'fastapi.security',
+    'APIKeyHeader': 'fastapi.security',
+    'APIKeyQuery': 'fastapi.security',
+    'HTTPAuthorizationCredentials': 'fastapi.security',
+    'HTTPBasic': 'fastapi.security',
+    'HTTPBasicCredentials': 'fastapi.security',
+    'HTTPBearer': 'fastapi.security',
+    'HTTPDigest': 'fastapi.security',
+    'OAuth2': 'fastapi.security',
+    'OAuth2AuthorizationCodeBearer': 'fastapi.security',
+    'OAuth2PasswordBearer': 'fastapi.security',
+    'OpenIdConnect': 'fastapi.security',
+    'SecurityScopes': 'fastapi.security',
+}
+"""The security schemes provided by FastAPI, imported on first access to avoid
+loading the FastAPI security package when importing this module."""
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all_dynamic__:
+        raise AttributeError(f"Module {__name__!r} has no attribute {name!r}.")
+
+    from importlib import import_module
+
+    module = import_module(__all_dynamic__[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+class OAuth2Type(StrEnum):
+    """OAuth2 base type.
+
+    The OAuth2 types are string enumerations whose members are looked up by
+    value through the enumeration value map, so that membership checks through
+    `has` do not go through the enumeration call machinery.
+    """
+
+    @classmethod
+    def has(cls, value: Any) -> bool:
+        """Check whether the given value is a member value of the type."""
+        try:
+            return value in cls._value2member_map_
+        except TypeError:
+            return False
+
+
+class OAuth2ClientType(OAuth2Type):
     """OAuth2 client type."""
     PUBLIC = 'public'
     CONFIDENTIAL = 'confidential'
 
 
-class OAuth2FlowType(StrEnum):
+class OAuth2FlowType(OAuth2Type):
     """OAuth2 authorization flow type."""
     AUTHORIZATION_CODE = 'authorization_code'
     CLIENT_CREDENTIALS = 'client_credentials'
@@ -88,7 +152,7 @@ class OAuth2FlowType(StrEnum):
     PASSWORD = 'password'
 
 
-class OAuth2GrantType(StrEnum):
+class OAuth2GrantType(OAuth2Type):
     """OAuth2 authorization grant type."""
     AUTHORIZATION_CODE = 'authorization_code'
     CLIENT_CREDENTIALS = 'client_credentials'
@@ -96,13 +160,13 @@ class OAuth2GrantType(StrEnum):
     REFRESH_TOKEN = 'refresh_token'
 
 
-class OAuth2ResponseType(StrEnum):
+class OAuth2ResponseType(OAuth2Type):
     """OAuth2 authorization response type."""
     CODE = 'code'
     TOKEN = 'token'
 
 
-class OAuth2RevocationType(StrEnum):
+class OAuth2RevocationType(OAuth2Type):
     """OAuth2 token revocation type."""
     MANUAL = 'manual'
     EXPIRATION = 'expiration'
@@ -110,35 +174,14 @@ class OAuth2RevocationType(StrEnum):
     SECURITY = 'security'
 
 
-class OAuth2TokenType(StrEnum):
+class OAuth2TokenType(OAuth2Type):
     """OAuth2 authorization token type."""
     BASIC = 'basic'
     BEARER = 'bearer'
     MAC = 'mac'
 
 
-OAuth2AuthorizeEndpointRequestForm = Annotated[
-    Union[
-        'OAuth2AuthorizationCodeRequestForm',
-        'OAuth2ImplicitRequestForm',
-    ],
-    Discriminator('response_type'),
-]
-"""The OAuth2 authorize endpoint request form schema."""
-
-
-OAuth2TokenEndpointRequestForm = Annotated[
-    Union[
-        'OAuth2AuthorizationTokenRequestForm',
-        'OAuth2ClientCredentialsRequestForm',
-        'OAuth2PasswordRequestForm',
-        'OAuth2RefreshTokenRequestForm',
-    ],
-    Discriminator('grant_type'),
-]
-"""The OAuth2 token endpoint request form schema."""
-
-
+@dataclasses.dataclass(kw_only=True, slots=True)
 class OAuth2AuthorizationCodeRequestForm:
     """The OAuth2 authorization code request form schema.
 
@@ -153,121 +196,109 @@ class OAuth2AuthorizationCodeRequestForm:
         - https://www.rfc-editor.org/rfc/rfc7636#section-4.3
     """
 
-    def __init__(
-        self,
-        *,
-        response_type: Annotated[
-            Literal[OAuth2ResponseType.CODE],
-            Form(
-                title='Response type',
-                description="""The response type set to `code` for the OAuth2
-                    authorization code flow. It is used to distinguish between
-                    OAuth2 authorization code and implicit grant types.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.1
-                    """,
-            )
-        ] = OAuth2ResponseType.CODE,
-        client_id: Annotated[
-            str,
-            Form(
-                title='Client identifier',
-                description="""The client identifier for the OAuth2
-                    authorization code flow. It is used to identify the client
-                    application requesting the authorization code. It must be
-                    registered with the authorization server for the OAuth2
-                    authorization code flow.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
-                    """,
-            )
-        ],
-        redirect_uri: Annotated[
-            HttpUrl | None,
-            Form(
-                title='Redirect URI',
-                description="""The redirect URI for the OAuth2 authorization
-                    code flow. It must match one of the redirect URI registered
-                    with the specified client.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.1.2
-                    """,
-            ),
-        ] = None,
-        scope: Annotated[
-            str | None,
-            Form(
-                title='Scope',
-                description="""The scope for the OAuth2 authorization code
-                    flow. It may be used to request specific permissions from
-                    the user for the specified client.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
-                    """,
-            ),
-        ] = None,
-        state: Annotated[
-            SecretStr | None,
-            Form(
-                title='State',
-                description="""The state for the OAuth2 authorization code
-                    flow. It is an opaque value used by the client application
-                    to maintain state between the request and callback. It
-                    helps to prevent cross-site request forgery (CSRF) attacks.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-10.12
-                    """,
-            ),
-        ] = None,
-        code_challenge: Annotated[
-            SecretStr | None,
-            Form(
-                title='Code challenge',
-                description="""The code challenge for the OAuth2 authorization
-                    code flow. It is a cryptographically random value used to
-                    prevent code injection attacks. It must be generated by the
-                    client application using the code verifier.
-                    See https://www.rfc-editor.org/rfc/rfc7636#section-4
-                    """,
-            ),
-        ] = None,
-        code_challenge_method: Annotated[
-            Literal['plain', 'S256'],
-            Form(
-                title='Code challenge method',
-                description="""The code challenge method for the OAuth2
-                    authorization code flow. It is used to specify the method
-                    used to generate the code challenge. It should be set to
-                    `S256` for the OAuth2 authorization code flow.
-                    See https://www.rfc-editor.org/rfc/rfc7636#section-4
-                    """,
-            ),
-        ] = 'plain',
-        username: Annotated[
-            str,
-            Form(
-                title='Username',
-                description="""The username for the OAuth2 authorization code
-                    flow. It is used to authenticate the user requesting the
-                    authorization code.""",
-            ),
-        ],
-        password: Annotated[
-            SecretStr,
-            Form(
-                title='Password',
-                description="""The password for the OAuth2 authorization code
-                    flow. It is used to authenticate the user requesting the
-                    authorization code.""",
-            ),
-        ],
-    ) -> None:
-        self.response_type = response_type
-        self.client_id = client_id
-        self.redirect_uri = redirect_uri
-        self.scope = scope
-        self.state = state
-        self.code_challenge = code_challenge
-        self.code_challenge_method = code_challenge_method
-        self.username = username
-        self.password = password
-
-
+    response_type: Annotated[
+        Literal[OAuth2ResponseType.CODE],
+        Form(
+            title='Response type',
+            description="""The response type set to `code` for the OAuth2
+                authorization code flow. It is used to distinguish between
+                OAuth2 authorization code and implicit grant types.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.1
+                """,
+        )
+    ] = OAuth2ResponseType.CODE
+    client_id: Annotated[
+        str,
+        Form(
+            title='Client identifier',
+            description="""The client identifier for the OAuth2
+                authorization code flow. It is used to identify the client
+                application requesting the authorization code. It must be
+                registered with the authorization server for the OAuth2
+                authorization code flow.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
+                """,
+        )
+    ]
+    redirect_uri: Annotated[
+        HttpUrl | None,
+        Form(
+            title='Redirect URI',
+            description="""The redirect URI for the OAuth2 authorization
+                code flow. It must match one of the redirect URI registered
+                with the specified client.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.1.2
+                """,
+        ),
+    ] = None
+    scope: Annotated[
+        str | None,
+        Form(
+            title='Scope',
+            description="""The scope for the OAuth2 authorization code
+                flow. It may be used to request specific permissions from
+                the user for the specified client.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
+                """,
+        ),
+    ] = None
+    state: Annotated[
+        SecretStr | None,
+        Form(
+            title='State',
+            description="""The state for the OAuth2 authorization code
+                flow. It is an opaque value used by the client application
+                to maintain state between the request and callback. It
+                helps to prevent cross-site request forgery (CSRF) attacks.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-10.12
+                """,
+        ),
+    ] = None
+    code_challenge: Annotated[
+        SecretStr | None,
+        Form(
+            title='Code challenge',
+            description="""The code challenge for the OAuth2 authorization
+                code flow. It is a cryptographically random value used to
+                prevent code injection attacks. It must be generated by the
+                client application using the code verifier.
+                See https://www.rfc-editor.org/rfc/rfc7636#section-4
+                """,
+        ),
+    ] = None
+    code_challenge_method: Annotated[
+        Literal['plain', 'S256'],
+        Form(
+            title='Code challenge method',
+            description="""The code challenge method for the OAuth2
+                authorization code flow. It is used to specify the method
+                used to generate the code challenge. It should be set to
+                `S256` for the OAuth2 authorization code flow.
+                See https://www.rfc-editor.org/rfc/rfc7636#section-4
+                """,
+        ),
+    ] = 'plain'
+    username: Annotated[
+        str,
+        Form(
+            title='Username',
+            description="""The username for the OAuth2 authorization code
+                flow. It is used to authenticate the user requesting the
+                authorization code.""",
+        ),
+    ]
+    password: Annotated[
+        SecretStr,
+        Form(
+            title='Password',
+            description="""The password for the OAuth2 authorization code
+                flow. It is used to authenticate the user requesting the
+                authorization code.""",
+        ),
+    ]
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
 class OAuth2AuthorizationTokenRequestForm:
     """The OAuth2 authorization access token request form schema.
 
@@ -281,90 +312,81 @@ class OAuth2AuthorizationTokenRequestForm:
         - https://www.rfc-editor.org/rfc/rfc6749#section-4.1.3
     """
 
-    def __init__(
-        self,
-        *,
-        grant_type: Annotated[
-            Literal[OAuth2GrantType.AUTHORIZATION_CODE],
-            Form(
-                title='Grant type',
-                description="""The grant type set to `authorization_code` for
-                    the OAuth2 authorization code flow. It is used to
-                    distinguish between OAuth2 grant types.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-4.1.3
-                    """,
-            )
-        ] = OAuth2GrantType.AUTHORIZATION_CODE,
-        code: Annotated[
-            SecretStr,
-            Form(
-                title='Code',
-                description="""The code for the OAuth2 authorization code flow.
-                    It is used to exchange the authorization code for an access
-                    token.""",
-            ),
-        ],
-        redirect_uri: Annotated[
-            HttpUrl | None,
-            Form(
-                title='Redirect URI',
-                description="""The redirect URI for the OAuth2 authorization
-                    code flow. It must match one of the redirect URI registered
-                    with the specified client.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.1.2
-                    """,
-            ),
-        ] = None,
-        client_id: Annotated[
-            str | None,
-            Form(
-                title='Client identifier',
-                description="""The client identifier for the OAuth2
-                    authorization code flow. It is used to identify the client
-                    application requesting the access token. It must be
-                    registered with the authorization server for the OAuth2
-                    authorization code flow. For confidential clients, using
-                    basic authentication instead of including the client
-                    credentials in the request body is recommended.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
-                    """,
-            ),
-        ] = None,
-        client_secret: Annotated[
-            SecretStr | None,
-            Form(
-                title='Client secret',
-                description="""The client secret for the OAuth2 authorization
-                    code flow. It is used to authenticate the client
-                    application requesting the access token. It must be
-                    registered with the authorization server for the OAuth2
-                    authorization code flow. For confidential clients, using
-                    basic authentication instead of including the client
-                    credentials in the request body is recommended.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.3.1
-                    """,
-            ),
-        ] = None,
-        code_verifier: Annotated[
-            SecretStr | None,
-            Form(
-                title='Code verifier',
-                description="""The code verifier for the OAuth2 authorization
-                    code flow. It is used to verify the code challenge sent
-                    during the authorization code request.
-                    See https://www.rfc-editor.org/rfc/rfc7636#section-4
-                    """,
-            ),
-        ] = None,
-    ) -> None:
-        self.grant_type = grant_type
-        self.code = code
-        self.redirect_uri = redirect_uri
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.code_verifier = code_verifier
-
-
+    grant_type: Annotated[
+        Literal[OAuth2GrantType.AUTHORIZATION_CODE],
+        Form(
+            title='Grant type',
+            description="""The grant type set to `authorization_code` for
+                the OAuth2 authorization code flow. It is used to
+                distinguish between OAuth2 grant types.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-4.1.3
+                """,
+        )
+    ] = OAuth2GrantType.AUTHORIZATION_CODE
+    code: Annotated[
+        SecretStr,
+        Form(
+            title='Code',
+            description="""The code for the OAuth2 authorization code flow.
+                It is used to exchange the authorization code for an access
+                token.""",
+        ),
+    ]
+    redirect_uri: Annotated[
+        HttpUrl | None,
+        Form(
+            title='Redirect URI',
+            description="""The redirect URI for the OAuth2 authorization
+                code flow. It must match one of the redirect URI registered
+                with the specified client.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.1.2
+                """,
+        ),
+    ] = None
+    client_id: Annotated[
+        str | None,
+        Form(
+            title='Client identifier',
+            description="""The client identifier for the OAuth2
+                authorization code flow. It is used to identify the client
+                application requesting the access token. It must be
+                registered with the authorization server for the OAuth2
+                authorization code flow. For confidential clients, using
+                basic authentication instead of including the client
+                credentials in the request body is recommended.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
+                """,
+        ),
+    ] = None
+    client_secret: Annotated[
+        SecretStr | None,
+        Form(
+            title='Client secret',
+            description="""The client secret for the OAuth2 authorization
+                code flow. It is used to authenticate the client
+                application requesting the access token. It must be
+                registered with the authorization server for the OAuth2
+                authorization code flow. For confidential clients, using
+                basic authentication instead of including the client
+                credentials in the request body is recommended.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.3.1
+                """,
+        ),
+    ] = None
+    code_verifier: Annotated[
+        SecretStr | None,
+        Form(
+            title='Code verifier',
+            description="""The code verifier for the OAuth2 authorization
+                code flow. It is used to verify the code challenge sent
+                during the authorization code request.
+                See https://www.rfc-editor.org/rfc/rfc7636#section-4
+                """,
+        ),
+    ] = None
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
 class OAuth2ClientCredentialsRequestForm:
     """The OAuth2 client credentials request form schema.
 
@@ -378,68 +400,61 @@ class OAuth2ClientCredentialsRequestForm:
         - https://www.rfc-editor.org/rfc/rfc6749#section-4.4
     """
 
-    def __init__(
-        self,
-        *,
-        grant_type: Annotated[
-            Literal[OAuth2GrantType.CLIENT_CREDENTIALS],
-            Form(
-                title='Grant type',
-                description="""The grant type set to `client_credentials` for
-                    the OAuth2 client credentials flow. It is used to
-                    distinguish between OAuth2 grant types.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-4.4
-                    """,
-            )
-        ] = OAuth2GrantType.CLIENT_CREDENTIALS,
-        client_id: Annotated[
-            str | None,
-            Form(
-                title='Client identifier',
-                description="""The client identifier for the OAuth2 client
-                    credentials flow. It is used to identify the client
-                    application requesting the access token. It must be
-                    registered with the authorization server for the OAuth2
-                    client credentials flow. For confidential clients, using
-                    basic authentication instead of including the client
-                    credentials in the request body is recommended.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
-                    """,
-            ),
-        ] = None,
-        client_secret: Annotated[
-            SecretStr | None,
-            Form(
-                title='Client secret',
-                description="""The client secret for the OAuth2 client
-                    credentials flow. It is used to authenticate the client
-                    application requesting the access token. It must be
-                    registered with the authorization server for the OAuth2
-                    client credentials flow. For confidential clients, using
-                    basic authentication instead of including the client
-                    credentials in the request body is recommended.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.3.1
-                    """,
-            ),
-        ] = None,
-        scope: Annotated[
-            str | None,
-            Form(
-                title='Scope',
-                description="""The scope for the OAuth2 client credentials
-                    flow. It may be used to request specific permissions from
-                    the user for the specified client.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
-                    """,
-            ),
-        ] = None,
-    ) -> None:
-        self.grant_type = grant_type
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.scope = scope
-
-
+    grant_type: Annotated[
+        Literal[OAuth2GrantType.CLIENT_CREDENTIALS],
+        Form(
+            title='Grant type',
+            description="""The grant type set to `client_credentials` for
+                the OAuth2 client credentials flow. It is used to
+                distinguish between OAuth2 grant types.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-4.4
+                """,
+        )
+    ] = OAuth2GrantType.CLIENT_CREDENTIALS
+    client_id: Annotated[
+        str | None,
+        Form(
+            title='Client identifier',
+            description="""The client identifier for the OAuth2 client
+                credentials flow. It is used to identify the client
+                application requesting the access token. It must be
+                registered with the authorization server for the OAuth2
+                client credentials flow. For confidential clients, using
+                basic authentication instead of including the client
+                credentials in the request body is recommended.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
+                """,
+        ),
+    ] = None
+    client_secret: Annotated[
+        SecretStr | None,
+        Form(
+            title='Client secret',
+            description="""The client secret for the OAuth2 client
+                credentials flow. It is used to authenticate the client
+                application requesting the access token. It must be
+                registered with the authorization server for the OAuth2
+                client credentials flow. For confidential clients, using
+                basic authentication instead of including the client
+                credentials in the request body is recommended.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.3.1
+                """,
+        ),
+    ] = None
+    scope: Annotated[
+        str | None,
+        Form(
+            title='Scope',
+            description="""The scope for the OAuth2 client credentials
+                flow. It may be used to request specific permissions from
+                the user for the specified client.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
+                """,
+        ),
+    ] = None
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
 class OAuth2ImplicitRequestForm:
     """The OAuth2 implicit request form schema.
 
@@ -452,94 +467,84 @@ class OAuth2ImplicitRequestForm:
         - https://www.rfc-editor.org/rfc/rfc6749#section-4.2.1
     """
 
-    def __init__(
-        self,
-        *,
-        response_type: Annotated[
-            Literal[OAuth2ResponseType.TOKEN],
-            Form(
-                title='Response type',
-                description="""The response type set to `token` for the OAuth2
-                    implicit flow. It is used to distinguish between OAuth2
-                    authorization code and implicit grant types.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.1
-                    """,
-            )
-        ] = OAuth2ResponseType.TOKEN,
-        client_id: Annotated[
-            str,
-            Form(
-                title='Client identifier',
-                description="""The client identifier for the OAuth2 implicit
-                    flow. It is used to identify the client application
-                    requesting the access token. It must be registered with the
-                    authorization server for the OAuth2 implicit flow.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
-                    """,
-            )
-        ],
-        redirect_uri: Annotated[
-            HttpUrl | None,
-            Form(
-                title='Redirect URI',
-                description="""The redirect URI for the OAuth2 implicit flow.
-                    It must match one of the redirect URI registered with the
-                    specified client.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.1.2
-                    """,
-            ),
-        ] = None,
-        scope: Annotated[
-            str | None,
-            Form(
-                title='Scope',
-                description="""The scope for the OAuth2 implicit flow. It
-                    may be used to request specific permissions from the user
-                    for the specified client.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
-                    """,
-            ),
-        ] = None,
-        state: Annotated[
-            SecretStr | None,
-            Form(
-                title='State',
-                description="""The state for the OAuth2 implicit flow. It is an
-                    opaque value used by the client application to maintain
-                    state between the request and callback. It helps to prevent
-                    cross-site request forgery (CSRF) attacks.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-10.12
-                    """,
-            ),
-        ] = None,
-        username: Annotated[
-            str,
-            Form(
-                title='Username',
-                description="""The username for the OAuth2 implicit flow. It
-                    is used to authenticate the user requesting the access
-                    token.""",
-            ),
-        ],
-        password: Annotated[
-            SecretStr,
-            Form(
-                title='Password',
-                description="""The password for the OAuth2 implicit flow. It
-                    is used to authenticate the user requesting the access
-                    token.""",
-            ),
-        ],
-    ) -> None:
-        self.response_type = response_type
-        self.client_id = client_id
-        self.redirect_uri = redirect_uri
-        self.scope = scope
-        self.state = state
-        self.username = username
-        self.password = password
-
-
+    response_type: Annotated[
+        Literal[OAuth2ResponseType.TOKEN],
+        Form(
+            title='Response type',
+            description="""The response type set to `token` for the OAuth2
+                implicit flow. It is used to distinguish between OAuth2
+                authorization code and implicit grant types.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.1
+                """,
+        )
+    ] = OAuth2ResponseType.TOKEN
+    client_id: Annotated[
+        str,
+        Form(
+            title='Client identifier',
+            description="""The client identifier for the OAuth2 implicit
+                flow. It is used to identify the client application
+                requesting the access token. It must be registered with the
+                authorization server for the OAuth2 implicit flow.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
+                """,
+        )
+    ]
+    redirect_uri: Annotated[
+        HttpUrl | None,
+        Form(
+            title='Redirect URI',
+            description="""The redirect URI for the OAuth2 implicit flow.
+                It must match one of the redirect URI registered with the
+                specified client.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.1.2
+                """,
+        ),
+    ] = None
+    scope: Annotated[
+        str | None,
+        Form(
+            title='Scope',
+            description="""The scope for the OAuth2 implicit flow. It
+                may be used to request specific permissions from the user
+                for the specified client.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
+                """,
+        ),
+    ] = None
+    state: Annotated[
+        SecretStr | None,
+        Form(
+            title='State',
+            description="""The state for the OAuth2 implicit flow. It is an
+                opaque value used by the client application to maintain
+                state between the request and callback. It helps to prevent
+                cross-site request forgery (CSRF) attacks.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-10.12
+                """,
+        ),
+    ] = None
+    username: Annotated[
+        str,
+        Form(
+            title='Username',
+            description="""The username for the OAuth2 implicit flow. It
+                is used to authenticate the user requesting the access
+                token.""",
+        ),
+    ]
+    password: Annotated[
+        SecretStr,
+        Form(
+            title='Password',
+            description="""The password for the OAuth2 implicit flow. It
+                is used to authenticate the user requesting the access
+                token.""",
+        ),
+    ]
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
 class OAuth2PasswordRequestForm:
     """The OAuth2 password request form schema.
 
@@ -552,88 +557,79 @@ class OAuth2PasswordRequestForm:
         - https://www.rfc-editor.org/rfc/rfc6749#section-4.3
     """
 
-    def __init__(
-        self,
-        *,
-        grant_type: Annotated[
-            Literal[OAuth2GrantType.PASSWORD],
-            Form(
-                title='Grant type',
-                description="""The grant type set to `password` for the OAuth2
-                    password flow. It is used to distinguish between OAuth2
-                    grant types.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-4.3
-                    """,
-            )
-        ] = OAuth2GrantType.PASSWORD,
-        client_id: Annotated[
-            str | None,
-            Form(
-                title='Client identifier',
-                description="""The client identifier for the OAuth2 password
-                    flow. It is used to identify the client application
-                    requesting the access token. It must be registered with the
-                    authorization server for the OAuth2 password flow. For
-                    confidential clients, using basic authentication instead of
-                    including the client credentials in the request body is
-                    recommended.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
-                    """,
-            )
-        ] = None,
-        client_secret: Annotated[
-            SecretStr | None,
-            Form(
-                title='Client secret',
-                description="""The client secret for the OAuth2 password flow.
-                    It is used to authenticate the client application
-                    requesting the access token. It must be registered with the
-                    authorization server for the OAuth2 password flow. For
-                    confidential clients, using basic authentication instead of
-                    including the client credentials in the request body is
-                    recommended.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.3.1
-                    """,
-            ),
-        ] = None,
-        scope: Annotated[
-            str | None,
-            Form(
-                title='Scope',
-                description="""The scope for the OAuth2 password flow. It may
-                    be used to request specific permissions from the user for
-                    the specified client.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
-                    """,
-            ),
-        ] = None,
-        username: Annotated[
-            str,
-            Form(
-                title='Username',
-                description="""The username for the OAuth2 password flow. It is
-                    used to authenticate the user requesting the access token.
-                    """,
-            ),
-        ],
-        password: Annotated[
-            SecretStr,
-            Form(
-                title='Password',
-                description="""The password for the OAuth2 password flow. It is
-                    used to authenticate the user requesting the access token.
-                    """,
-            ),
-        ],
-    ) -> None:
-        self.grant_type = grant_type
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.scope = scope
-        self.username = username
-        self.password = password
-
-
+    grant_type: Annotated[
+        Literal[OAuth2GrantType.PASSWORD],
+        Form(
+            title='Grant type',
+            description="""The grant type set to `password` for the OAuth2
+                password flow. It is used to distinguish between OAuth2
+                grant types.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-4.3
+                """,
+        )
+    ] = OAuth2GrantType.PASSWORD
+    client_id: Annotated[
+        str | None,
+        Form(
+            title='Client identifier',
+            description="""The client identifier for the OAuth2 password
+                flow. It is used to identify the client application
+                requesting the access token. It must be registered with the
+                authorization server for the OAuth2 password flow. For
+                confidential clients, using basic authentication instead of
+                including the client credentials in the request body is
+                recommended.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
+                """,
+        )
+    ] = None
+    client_secret: Annotated[
+        SecretStr | None,
+        Form(
+            title='Client secret',
+            description="""The client secret for the OAuth2 password flow.
+                It is used to authenticate the client application
+                requesting the access token. It must be registered with the
+                authorization server for the OAuth2 password flow. For
+                confidential clients, using basic authentication instead of
+                including the client credentials in the request body is
+                recommended.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.3.1
+                """,
+        ),
+    ] = None
+    scope: Annotated[
+        str | None,
+        Form(
+            title='Scope',
+            description="""The scope for the OAuth2 password flow. It may
+                be used to request specific permissions from the user for
+                the specified client.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
+                """,
+        ),
+    ] = None
+    username: Annotated[
+        str,
+        Form(
+            title='Username',
+            description="""The username for the OAuth2 password flow. It is
+                used to authenticate the user requesting the access token.
+                """,
+        ),
+    ]
+    password: Annotated[
+        SecretStr,
+        Form(
+            title='Password',
+            description="""The password for the OAuth2 password flow. It is
+                used to authenticate the user requesting the access token.
+                """,
+        ),
+    ]
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
 class OAuth2RefreshTokenRequestForm:
     """The OAuth2 refresh token request form schema.
 
@@ -646,74 +642,159 @@ class OAuth2RefreshTokenRequestForm:
         - https://www.rfc-editor.org/rfc/rfc6749#section-6
     """
 
-    def __init__(
-        self,
-        *,
-        grant_type: Annotated[
-            Literal[OAuth2GrantType.REFRESH_TOKEN],
-            Form(
-                title='Grant type',
-                description="""The grant type set to `refresh_token` for the
-                    OAuth2 authorization flows. It is used to distinguish
-                    between OAuth2 grant types.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-6
-                    """,
-            )
-        ] = OAuth2GrantType.REFRESH_TOKEN,
-        refresh_token: Annotated[
-            SecretStr,
-            Form(
-                title='Refresh token',
-                description="""The refresh token for the OAuth2 authorization
-                    flows. It is used to exchange the refresh token for a new
-                    access token.""",
-            ),
-        ],
-        client_id: Annotated[
-            str | None,
-            Form(
-                title='Client identifier',
-                description="""The client identifier for the OAuth2 refresh
-                    token. It is used to identify the client application
-                    requesting the access token. It must be the same as the
-                    client identifier used to obtain the refresh token. For
-                    confidential clients, using basic authentication instead of
-                    including the client credentials in the request body is
-                    recommended.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
-                    """,
-            ),
-        ],
-        client_secret: Annotated[
-            SecretStr | None,
-            Form(
-                title='Client secret',
-                description="""The client secret for the OAuth2 refresh token.
-                    It is used to authenticate the client application
-                    requesting the access token. For confidential clients,
-                    using basic authentication instead of including the client
-                    credentials in the request body is recommended.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-2.3.1
-                    """,
-            ),
-        ] = None,
-        scope: Annotated[
-            str,
-            Form(
-                title='Scope',
-                description="""The scope for the OAuth2 access request. It may
-                    be used to request specific permissions from the user for
-                    the client application. The requested scope must not
-                    include any scope not originally granted by the resource
-                    owner, and if omitted is treated as equal to the scope
-                    originally granted by the resource owner.
-                    See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
-                    """,
-            ),
-        ] = '',
-    ) -> None:
-        self.grant_type = grant_type
-        self.refresh_token = refresh_token
-        self.client_id = client_id
-        self.client_secret = client_secret
-        self.scope = scope
+    grant_type: Annotated[
+        Literal[OAuth2GrantType.REFRESH_TOKEN],
+        Form(
+            title='Grant type',
+            description="""The grant type set to `refresh_token` for the
+                OAuth2 authorization flows. It is used to distinguish
+                between OAuth2 grant types.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-6
+                """,
+        )
+    ] = OAuth2GrantType.REFRESH_TOKEN
+    refresh_token: Annotated[
+        SecretStr,
+        Form(
+            title='Refresh token',
+            description="""The refresh token for the OAuth2 authorization
+                flows. It is used to exchange the refresh token for a new
+                access token.""",
+        ),
+    ]
+    client_id: Annotated[
+        str | None,
+        Form(
+            title='Client identifier',
+            description="""The client identifier for the OAuth2 refresh
+                token. It is used to identify the client application
+                requesting the access token. It must be the same as the
+                client identifier used to obtain the refresh token. For
+                confidential clients, using basic authentication instead of
+                including the client credentials in the request body is
+                recommended.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.2
+                """,
+        ),
+    ]
+    client_secret: Annotated[
+        SecretStr | None,
+        Form(
+            title='Client secret',
+            description="""The client secret for the OAuth2 refresh token.
+                It is used to authenticate the client application
+                requesting the access token. For confidential clients,
+                using basic authentication instead of including the client
+                credentials in the request body is recommended.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-2.3.1
+                """,
+        ),
+    ] = None
+    scope: Annotated[
+        str,
+        Form(
+            title='Scope',
+            description="""The scope for the OAuth2 access request. It may
+                be used to request specific permissions from the user for
+                the client application. The requested scope must not
+                include any scope not originally granted by the resource
+                owner, and if omitted is treated as equal to the scope
+                originally granted by the resource owner.
+                See https://www.rfc-editor.org/rfc/rfc6749#section-3.3
+                """,
+        ),
+    ] = ''
+
+
+OAuth2AuthorizeEndpointRequestForm = Annotated[
+    Union[
+        OAuth2AuthorizationCodeRequestForm,
+        OAuth2ImplicitRequestForm,
+    ],
+    Discriminator('response_type'),
+]
+"""The OAuth2 authorize endpoint request form schema."""
+
+
+OAuth2TokenEndpointRequestForm = Annotated[
+    Union[
+        OAuth2AuthorizationTokenRequestForm,
+        OAuth2ClientCredentialsRequestForm,
+        OAuth2PasswordRequestForm,
+        OAuth2RefreshTokenRequestForm,
+    ],
+    Discriminator('grant_type'),
+]
+"""The OAuth2 token endpoint request form schema."""
+
+
+OAUTH2_AUTHORIZE_ENDPOINT_ADAPTER: TypeAdapter[
+    OAuth2AuthorizeEndpointRequestForm
+] = TypeAdapter(OAuth2AuthorizeEndpointRequestForm)
+"""The OAuth2 authorize endpoint request form type adapter."""
+
+
+OAUTH2_TOKEN_ENDPOINT_ADAPTER: TypeAdapter[
+    OAuth2TokenEndpointRequestForm
+] = TypeAdapter(OAuth2TokenEndpointRequestForm)
+"""The OAuth2 token endpoint request form type adapter."""
+
+
+def validate_authorize_request_form(
+    obj: Any,
+) -> OAuth2AuthorizeEndpointRequestForm:
+    """Validate an OAuth2 authorize endpoint request form.
+
+    The request form is validated against the discriminated union of the
+    authorize endpoint request forms using the `response_type` parameter. The
+    union validator is built once at import time and shared by all calls.
+
+    Args:
+        obj: The request form data to validate.
+
+    Returns:
+        The validated authorize endpoint request form.
+    """
+    return OAUTH2_AUTHORIZE_ENDPOINT_ADAPTER.validate_python(obj)
+
+
+def validate_token_request_form(
+    obj: Any,
+) -> OAuth2TokenEndpointRequestForm:
+    """Validate an OAuth2 token endpoint request form.
+
+    The request form is validated against the discriminated union of the
+    token endpoint request forms using the `grant_type` parameter. The union
+    validator is built once at import time and shared by all calls.
+
+    Args:
+        obj: The request form data to validate.
+
+    Returns:
+        The validated token endpoint request form.
+    """
+    return OAUTH2_TOKEN_ENDPOINT_ADAPTER.validate_python(obj)
+
+
+@lru_cache(maxsize=None)
+def get_request_form_dependant(form: type[Any]) -> 'Dependant':
+    """Get the FastAPI dependant of an OAuth2 request form.
+
+    The request form signature is analyzed into a FastAPI dependant on first
+    call and cached, so that routes registering the same request form share a
+    single dependant instead of analyzing the form parameters again. The
+    returned dependant is shared and must not be mutated.
+
+    Args:
+        form: The OAuth2 request form class to analyze.
+
+    Returns:
+        The cached FastAPI dependant of the request form.
+
+    Note:
+        Dependants are not built at import time as analyzing form parameters
+        requires the optional `python-multipart` package.
+    """
+    from fastapi.dependencies.utils import get_dependant
+
+    return get_dependant(path='', call=form)
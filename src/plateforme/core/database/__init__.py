@@ -9,3 +9,477 @@
 This package provides utilities for managing databases within the Plateforme
 framework using SQLAlchemy features.
 """
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from .base import inspect
+    from .engines import (
+        async_engine_from_config,
+        create_async_engine,
+        create_engine,
+        create_mock_engine,
+        engine_from_config,
+    )
+    from .expressions import (
+        alias,
+        all_,
+        and_,
+        any_,
+        asc,
+        between,
+        bindparam,
+        case,
+        cast,
+        collate,
+        column,
+        cte,
+        delete,
+        desc,
+        distinct,
+        except_,
+        except_all,
+        exists,
+        extract,
+        false,
+        func,
+        funcfilter,
+        insert,
+        intersect,
+        intersect_all,
+        join,
+        label,
+        lambda_stmt,
+        lateral,
+        literal,
+        literal_column,
+        modifier,
+        not_,
+        null,
+        nulls_first,
+        nulls_last,
+        nullsfirst,
+        nullslast,
+        or_,
+        outerjoin,
+        outparam,
+        over,
+        select,
+        table,
+        tablesample,
+        text,
+        true,
+        tuple_,
+        type_coerce,
+        union,
+        union_all,
+        update,
+        values,
+        within_group,
+    )
+    from .orm import (
+        contains_eager,
+        defaultload,
+        defer,
+        immediateload,
+        joinedload,
+        lazyload,
+        load_only,
+        noload,
+        raiseload,
+        selectin_polymorphic,
+        selectinload,
+        subqueryload,
+        undefer,
+        undefer_group,
+        with_expression,
+        with_polymorphic,
+    )
+    from .routing import DatabaseRouter
+    from .sessions import (
+        AnySession,
+        AnySessionBulk,
+        AnySessionFactory,
+        AsyncSession,
+        AsyncSessionFactory,
+        Session,
+        SessionFactory,
+        async_prewarm_engine,
+        async_session_factory,
+        async_session_manager,
+        prewarm_engine,
+        session_factory,
+        session_manager,
+        set_expire_on_commit,
+    )
+    from .types import (
+        ARRAY,
+        BIGINT,
+        BINARY,
+        BLOB,
+        BOOLEAN,
+        CHAR,
+        CLOB,
+        DATE,
+        DATETIME,
+        DECIMAL,
+        DOUBLE,
+        DOUBLE_PRECISION,
+        FLOAT,
+        INTEGER,
+        JSON,
+        NCHAR,
+        NUMERIC,
+        NVARCHAR,
+        REAL,
+        SMALLINT,
+        TEXT,
+        TIME,
+        TIMESTAMP,
+        UUID,
+        VARBINARY,
+        VARCHAR,
+        BinaryEngine,
+        BooleanEngine,
+        DateEngine,
+        DateTimeEngine,
+        DefaultEngine,
+        EnumEngine,
+        IntegerEngine,
+        IntervalEngine,
+        JsonEngine,
+        NumericEngine,
+        StringEngine,
+        TimeEngine,
+        UuidEngine,
+    )
+    from .utils import (
+        apply_filter,
+        apply_reference,
+        apply_sort,
+        build_options,
+        build_query,
+    )
+
+__all__ = (
+    # Base
+    'inspect',
+    # Engines (async)
+    'async_engine_from_config',
+    'create_async_engine',
+    # Engines (sync)
+    'create_engine',
+    'create_mock_engine',
+    'engine_from_config',
+    # Expressions
+    'alias',
+    'all_',
+    'and_',
+    'any_',
+    'asc',
+    'between',
+    'bindparam',
+    'case',
+    'cast',
+    'collate',
+    'column',
+    'cte',
+    'delete',
+    'desc',
+    'distinct',
+    'except_',
+    'except_all',
+    'exists',
+    'extract',
+    'false',
+    'func',
+    'funcfilter',
+    'insert',
+    'intersect',
+    'intersect_all',
+    'join',
+    'label',
+    'lambda_stmt',
+    'lateral',
+    'literal',
+    'literal_column',
+    'modifier',
+    'not_',
+    'null',
+    'nulls_first',
+    'nulls_last',
+    'nullsfirst',
+    'nullslast',
+    'or_',
+    'outerjoin',
+    'outparam',
+    'over',
+    'select',
+    'table',
+    'tablesample',
+    'text',
+    'true',
+    'tuple_',
+    'type_coerce',
+    'union',
+    'union_all',
+    'update',
+    'values',
+    'within_group',
+    # ORM
+    'contains_eager',
+    'defaultload',
+    'defer',
+    'immediateload',
+    'joinedload',
+    'lazyload',
+    'load_only',
+    'noload',
+    'raiseload',
+    'selectin_polymorphic',
+    'selectinload',
+    'subqueryload',
+    'undefer',
+    'undefer_group',
+    'with_expression',
+    'with_polymorphic',
+    # Routing
+    'DatabaseRouter',
+    # Sessions
+    'AnySession',
+    'AnySessionBulk',
+    'AnySessionFactory',
+    # Sessions (async)
+    'AsyncSession',
+    'AsyncSessionFactory',
+    'async_prewarm_engine',
+    'async_session_factory',
+    'async_session_manager',
+    # Sessions (sync)
+    'Session',
+    'SessionFactory',
+    'prewarm_engine',
+    'session_factory',
+    'session_manager',
+    # Sessions (utilities)
+    'set_expire_on_commit',
+    # Types (concrete)
+    'ARRAY',
+    'BIGINT',
+    'BINARY',
+    'BLOB',
+    'BOOLEAN',
+    'CHAR',
+    'CLOB',
+    'DATE',
+    'DATETIME',
+    'DECIMAL',
+    'DOUBLE',
+    'DOUBLE_PRECISION',
+    'FLOAT',
+    'INTEGER',
+    'JSON',
+    'NCHAR',
+    'NUMERIC',
+    'NVARCHAR',
+    'REAL',
+    'SMALLINT',
+    'TEXT',
+    'TIME',
+    'TIMESTAMP',
+    'UUID',
+    'VARBINARY',
+    'VARCHAR',
+    # Types (engine)
+    'BinaryEngine',
+    'BooleanEngine',
+    'DateEngine',
+    'DateTimeEngine',
+    'DefaultEngine',
+    'EnumEngine',
+    'IntegerEngine',
+    'IntervalEngine',
+    'JsonEngine',
+    'NumericEngine',
+    'StringEngine',
+    'TimeEngine',
+    'UuidEngine',
+    # Utilities
+    'apply_filter',
+    'apply_reference',
+    'apply_sort',
+    'build_options',
+    'build_query',
+)
+
+
+# MARK: Dynamic Imports
+
+__all_dynamic__: dict[str, str] = {
+    # Base
+    'inspect': '.base',
+    # Engines (async)
+    'async_engine_from_config': '.engines',
+    'create_async_engine': '.engines',
+    # Engines (sync)
+    'create_engine': '.engines',
+    'create_mock_engine': '.engines',
+    'engine_from_config': '.engines',
+    # Expressions
+    'alias': '.expressions',
+    'all_': '.expressions',
+    'and_': '.expressions',
+    'any_': '.expressions',
+    'asc': '.expressions',
+    'between': '.expressions',
+    'bindparam': '.expressions',
+    'case': '.expressions',
+    'cast': '.expressions',
+    'collate': '.expressions',
+    'column': '.expressions',
+    'cte': '.expressions',
+    'delete': '.expressions',
+    'desc': '.expressions',
+    'distinct': '.expressions',
+    'except_': '.expressions',
+    'except_all': '.expressions',
+    'exists': '.expressions',
+    'extract': '.expressions',
+    'false': '.expressions',
+    'func': '.expressions',
+    'funcfilter': '.expressions',
+    'insert': '.expressions',
+    'intersect': '.expressions',
+    'intersect_all': '.expressions',
+    'join': '.expressions',
+    'label': '.expressions',
+    'lambda_stmt': '.expressions',
+    'lateral': '.expressions',
+    'literal': '.expressions',
+    'literal_column': '.expressions',
+    'modifier': '.expressions',
+    'not_': '.expressions',
+    'null': '.expressions',
+    'nulls_first': '.expressions',
+    'nulls_last': '.expressions',
+    'nullsfirst': '.expressions',
+    'nullslast': '.expressions',
+    'or_': '.expressions',
+    'outerjoin': '.expressions',
+    'outparam': '.expressions',
+    'over': '.expressions',
+    'select': '.expressions',
+    'table': '.expressions',
+    'tablesample': '.expressions',
+    'text': '.expressions',
+    'true': '.expressions',
+    'tuple_': '.expressions',
+    'type_coerce': '.expressions',
+    'union': '.expressions',
+    'union_all': '.expressions',
+    'update': '.expressions',
+    'values': '.expressions',
+    'within_group': '.expressions',
+    # ORM
+    'contains_eager': '.orm',
+    'defaultload': '.orm',
+    'defer': '.orm',
+    'immediateload': '.orm',
+    'joinedload': '.orm',
+    'lazyload': '.orm',
+    'load_only': '.orm',
+    'noload': '.orm',
+    'raiseload': '.orm',
+    'selectin_polymorphic': '.orm',
+    'selectinload': '.orm',
+    'subqueryload': '.orm',
+    'undefer': '.orm',
+    'undefer_group': '.orm',
+    'with_expression': '.orm',
+    'with_polymorphic': '.orm',
+    # Routing
+    'DatabaseRouter': '.routing',
+    # Sessions
+    'AnySession': '.sessions',
+    'AnySessionBulk': '.sessions',
+    'AnySessionFactory': '.sessions',
+    # Sessions (async)
+    'AsyncSession': '.sessions',
+    'AsyncSessionFactory': '.sessions',
+    'async_prewarm_engine': '.sessions',
+    'async_session_factory': '.sessions',
+    'async_session_manager': '.sessions',
+    # Sessions (sync)
+    'Session': '.sessions',
+    'SessionFactory': '.sessions',
+    'prewarm_engine': '.sessions',
+    'session_factory': '.sessions',
+    'session_manager': '.sessions',
+    # Sessions (utilities)
+    'set_expire_on_commit': '.sessions',
+    # Types (concrete)
+    'ARRAY': '.types',
+    'BIGINT': '.types',
+    'BINARY': '.types',
+    'BLOB': '.types',
+    'BOOLEAN': '.types',
+    'CHAR': '.types',
+    'CLOB': '.types',
+    'DATE': '.types',
+    'DATETIME': '.types',
+    'DECIMAL': '.types',
+    'DOUBLE': '.types',
+    'DOUBLE_PRECISION': '.types',
+    'FLOAT': '.types',
+    'INTEGER': '.types',
+    'JSON': '.types',
+    'NCHAR': '.types',
+    'NUMERIC': '.types',
+    'NVARCHAR': '.types',
+    'REAL': '.types',
+    'SMALLINT': '.types',
+    'TEXT': '.types',
+    'TIME': '.types',
+    'TIMESTAMP': '.types',
+    'UUID': '.types',
+    'VARBINARY': '.types',
+    'VARCHAR': '.types',
+    # Types (engine)
+    'BinaryEngine': '.types',
+    'BooleanEngine': '.types',
+    'DateEngine': '.types',
+    'DateTimeEngine': '.types',
+    'DefaultEngine': '.types',
+    'EnumEngine': '.types',
+    'IntegerEngine': '.types',
+    'IntervalEngine': '.types',
+    'JsonEngine': '.types',
+    'NumericEngine': '.types',
+    'StringEngine': '.types',
+    'TimeEngine': '.types',
+    'UuidEngine': '.types',
+    # Utilities
+    'apply_filter': '.utils',
+    'apply_reference': '.utils',
+    'apply_sort': '.utils',
+    'build_options': '.utils',
+    'build_query': '.utils',
+}
+"""The package members mapped to their submodules, imported on first access
+to avoid loading SQLAlchemy when importing this package."""
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all_dynamic__:
+        raise AttributeError(f"Module {__name__!r} has no attribute {name!r}.")
+
+    from importlib import import_module
+
+    module = import_module(__all_dynamic__[name], package=__name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -52,6 +52,8 @@ class DatabaseManager(Iterable[str]):
     def __init__(self,
         urls: EngineMap,
         routers: list[DatabaseRouter] | None = None,
+        *,
+        query_cache_size: int = 500,
     ) -> None:
         """Initialize the engine manager.
 
@@ -59,6 +61,10 @@ class DatabaseManager(Iterable[str]):
             urls: A dictionary of database engine URLs to be managed.
             routers: A list of database routers to be used for routing
                 operations. Defaults to an empty list.
+            query_cache_size: The size of the compiled SQL statements cache of
+                each managed engine, shared by all the sessions bound to the
+                engine. Setting it to ``0`` disables the statements caching.
+                Defaults to ``500``.
         """
         # Initialize urls
         self.urls = urls
@@ -74,8 +80,12 @@ class DatabaseManager(Iterable[str]):
             _, dialect, driver = match.groups()
             assert isinstance(dialect, str) and isinstance(driver, str)
             # Create engines
-            self.async_engines[alias] = create_async_engine(conn)
-            self.engines[alias] = create_engine(f'{dialect}://{address}')
+            self.async_engines[alias] = create_async_engine(
+                conn, query_cache_size=query_cache_size
+            )
+            self.engines[alias] = create_engine(
+                f'{dialect}://{address}', query_cache_size=query_cache_size
+            )
 
         # Initialize routers
         self.routers = routers or []
@@ -71,16 +71,18 @@ BulkMap = dict[BulkHash, list['BulkEntry']]
 """A type alias that maps bulk entries to their hash values."""
 
 
-BulkQuery = tuple[BulkSignature, Select[Any]]
-"""A type alias for a bulk query used for the resolution."""
+BulkQuery = tuple[tuple[BulkSignature, ...], Select[Any]]
+"""A type alias for a bulk query used for the resolution, along with the
+fields signatures it resolves."""
 
 
 BulkProcess = list[BulkQuery]
 """A type alias for a bulk process used for the resolution."""
 
 
-BulkResult = tuple[BulkSignature, Result[Any]]
-"""A type alias for a bulk result used for the resolution."""
+BulkResult = tuple[tuple[BulkSignature, ...], Result[Any]]
+"""A type alias for a bulk result used for the resolution, along with the
+fields signatures it resolves."""
 
 
 # MARK: Bulk
@@ -282,13 +284,15 @@ class Bulk(ABC, Generic[_T]):
         raise_errors: bool = True,
         scope: Literal['all', 'references', 'values'] = 'all',
         strategy: Literal['bind', 'hydrate'] = 'bind',
-    ) -> Generator[BulkQuery, BulkResult, None]:
+    ) -> Generator[BulkQuery | None, BulkResult, None]:
         """Resolution generator for the bulk manager.
 
         It should be used by the subclass to resolve the registered resource
         entries in the bulk. It yields the resolution queries and results to
         handle the resolution process, thus decoupling the asynchronous or
-        synchronous resolution process from the bulk manager.
+        synchronous resolution process from the bulk manager. Once all queries
+        are processed, it yields ``None`` to signal the end of the resolution,
+        so that the driver loop does not rely on `StopIteration`.
         """
         with self._lock:
             # Setup and process resolution queue
@@ -337,6 +341,8 @@ class Bulk(ABC, Generic[_T]):
                     self.unresolved[entity] -= set(entries)
                     self.resolved[entity] |= set(entries)
 
+        yield None
+
 
 # MARK: Utilities
 
@@ -438,28 +444,36 @@ def _build_resolution_process(
 
     Returns:
         A list of tuple with the bulk entity resolution process.
+
+    Note:
+        The conditions of all fields signatures are combined into a single
+        query, such that each resource type is resolved within a single
+        database round-trip regardless of the number of signatures.
     """
-    process = []
+    process: BulkProcess = []
+
+    if not conditions:
+        return process
 
     # Build identifier fields
     identifying_attrs = tuple(
         entity.resource_attributes[field] for field in ('id', 'type_')
     )
 
+    # Build query conditions
+    query_conditions = []
     for fields, values in conditions.items():
-        # Build query conditions
-        query_conditions = []
         for value in values:
             query_conditions.append(and_(*(
                 getattr(entity, name) == value[name] for name in fields
             )))
 
-        # Build query
-        query = select(entity).where(or_(*query_conditions))
-        if strategy == 'bind':
-            query = query.options(load_only(*identifying_attrs))
+    # Build query
+    query = select(entity).where(or_(*query_conditions))
+    if strategy == 'bind':
+        query = query.options(load_only(*identifying_attrs))
 
-        process.append((fields, query))
+    process.append((tuple(conditions.keys()), query))
 
     return process
 
@@ -496,7 +510,7 @@ def _handle_resolution_query(
     Returns:
         A set of resolved reference and value hashes.
     """
-    fields, buffer = result
+    signatures, buffer = result
     data = buffer.unique().fetchall()
 
     resolved: set[int] = set()
@@ -506,33 +520,38 @@ def _handle_resolution_query(
         assert len(record) == 1, "Expected a single mapped column."
         record = record[0]
 
-        # Retrieve record value and hash
-        record_value = {name: getattr(record, name) for name in fields}
-        record_hash = generate_hash(record_value)
+        # Retrieve record hashes for all signatures
+        record_hashes = []
+        for fields in signatures:
+            record_value = {name: getattr(record, name) for name in fields}
+            record_hash = generate_hash(record_value)
+            if record_hash in mapping:
+                record_hashes.append(record_hash)
 
-        # Validate record hash
-        if record_hash not in mapping:
+        # Validate record hashes
+        if not record_hashes:
             if not raise_errors:
                 continue
             raise DatabaseError(
-                f"A resolved entry with hash {record_hash!r} and value "
-                f"{record_value!r} was not found in the provided mapping."
+                f"A resolved entry {record!r} was not found in the provided "
+                f"mapping."
             )
 
         # Update resolved entries
-        for entry in mapping[record_hash]:
-            if entry.is_reference:
-                setattr(entry.instance, '__proxy_target__', record)
-            else:
-                for name in entity.resource_fields.keys():
-                    if name not in ('id', 'type_') \
-                            and name in entry.instance.resource_fields_set:
-                        continue
-                    entry.instance.__dict__[name] = getattr(record, name)
-                if strategy == 'bind':
-                    make_transient_to_detached(entry.instance)
+        for record_hash in record_hashes:
+            for entry in mapping[record_hash]:
+                if entry.is_reference:
+                    setattr(entry.instance, '__proxy_target__', record)
+                else:
+                    for name in entity.resource_fields.keys():
+                        if name not in ('id', 'type_') \
+                                and name in entry.instance.resource_fields_set:
+                            continue
+                        entry.instance.__dict__[name] = getattr(record, name)
+                    if strategy == 'bind':
+                        make_transient_to_detached(entry.instance)
 
-        resolved.add(record_hash)
+            resolved.add(record_hash)
 
     return resolved
 
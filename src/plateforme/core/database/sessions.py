@@ -11,7 +11,8 @@ Plateforme framework using SQLAlchemy features.
 """
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator, Iterator
+import typing
+from collections.abc import AsyncGenerator, Awaitable, Generator, Iterator
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any, Callable, Literal, TypeVar, Union
 
@@ -43,12 +44,14 @@ __all__ = (
     'AsyncSession',
     'AsyncSessionBulk',
     'AsyncSessionFactory',
+    'async_prewarm_engine',
     'async_session_factory',
     'async_session_manager',
     # Session (sync)
     'Session',
     'SessionBulk',
     'SessionFactory',
+    'prewarm_engine',
     'session_factory',
     'session_manager',
     # Utilities
@@ -86,6 +89,10 @@ class AsyncSession(_AsyncSession):
     Asyncio version of the `Session`. It is a proxy for a traditional class
     `Session` instance.
     """
+    if typing.TYPE_CHECKING:
+        routing: DatabaseManager | None
+
+    __slots__ = ('routing',)
 
     def __init__(
         self,
@@ -121,10 +128,9 @@ class AsyncSession(_AsyncSession):
         )
         self.routing = routing
 
-    @asynccontextmanager
-    async def bulk(
+    def bulk(
         self, *, proxy_reference: bool = True,
-    ) -> AsyncGenerator['AsyncSessionBulk', None]:
+    ) -> '_AsyncSessionBulkContext':
         """An async session bulk context manager for `AsyncSession` objects.
 
         The proxy option indicates that the provided resource references should
@@ -139,14 +145,9 @@ class AsyncSession(_AsyncSession):
                 be encapsulated with a proxy or not. Defaults to ``True``.
 
         Returns:
-            An `AsyncSessionBulk` instance.
+            A context manager yielding an `AsyncSessionBulk` instance.
         """
-        bulk = AsyncSessionBulk(self, proxy_reference=proxy_reference)
-        token = SESSION_BULK_CONTEXT.set(bulk)
-        try:
-            yield bulk
-        finally:
-            SESSION_BULK_CONTEXT.reset(token)
+        return _AsyncSessionBulkContext(self, proxy_reference)
 
     async def commit(self, *, expire: bool | None = None) -> None:
         """Flush pending changes and commit the current transaction.
@@ -159,8 +160,17 @@ class AsyncSession(_AsyncSession):
         """
         if expire is None:
             return await super().commit()
-        with set_expire_on_commit(expire, session=self):
+        # Swap the expire on commit flag of the underlying sync session
+        # directly, without going through the context manager.
+        sync_session = self.sync_session
+        expire_on_commit = sync_session.expire_on_commit
+        if expire_on_commit == expire:
             return await super().commit()
+        sync_session.expire_on_commit = expire
+        try:
+            return await super().commit()
+        finally:
+            sync_session.expire_on_commit = expire_on_commit
 
 
 class AsyncSessionBulk(Bulk[AsyncSession]):
@@ -208,20 +218,57 @@ class AsyncSessionBulk(Bulk[AsyncSession]):
             raise_errors=raise_errors, scope=scope, strategy=strategy
         )
 
+        execute = self.session.execute
+        send = resolver.send
         try:
             context = next(resolver)
-            while True:
-                fields, statement = context
-                result = await self.session.execute(statement)
-                context = resolver.send((fields, result))
-        except StopIteration:
-            pass
+            while context is not None:
+                signatures, statement = context
+                result = await execute(statement)
+                context = send((signatures, result))
+        finally:
+            resolver.close()
+
+
+class _AsyncSessionBulkContext:
+    """An async session bulk context manager.
+
+    It creates a new `AsyncSessionBulk` instance on entry and sets it as the
+    current session bulk until exit.
+    """
+
+    __slots__ = ('proxy_reference', 'session', 'token')
+
+    def __init__(self, session: AsyncSession, proxy_reference: bool) -> None:
+        self.session = session
+        self.proxy_reference = proxy_reference
+
+    async def __aenter__(self) -> AsyncSessionBulk:
+        bulk = AsyncSessionBulk(
+            self.session, proxy_reference=self.proxy_reference
+        )
+        self.token = SESSION_BULK_CONTEXT.set(bulk)
+        return bulk
+
+    async def __aexit__(self, *args: Any) -> None:
+        SESSION_BULK_CONTEXT.reset(self.token)
 
 
 # MARK: Session
 
 class Session(_Session):
     """Manages persistence operations synchronously for ORM-mapped objects."""
+    if typing.TYPE_CHECKING:
+        proxy: AsyncSession | None
+
+    __slots__ = (
+        '_bind_cache',
+        '_get_engine',
+        '_get_read_engine',
+        '_get_write_engine',
+        '_routing',
+        'proxy',
+    )
 
     def __init__(
         self,
@@ -259,6 +306,21 @@ class Session(_Session):
         """Whether the session is in async mode or not."""
         return self.proxy is not None
 
+    @property
+    def routing(self) -> DatabaseManager | None:
+        """The database manager used for the session routing."""
+        return self._routing
+
+    @routing.setter
+    def routing(self, value: DatabaseManager | None) -> None:
+        self._routing = value
+        self._bind_cache: dict[tuple[bool, Any], Engine] = {}
+        # Bind the routing engine getters once for the session lifetime
+        if value is not None:
+            self._get_read_engine = value.get_read_engine
+            self._get_write_engine = value.get_write_engine
+            self._get_engine = value.get_engine
+
     def get_bind(
         self,
         mapper: Mapper[_T] | type[_T] | None = None,
@@ -276,41 +338,70 @@ class Session(_Session):
 
         Returns:
             The `Engine` or `Connection` to which this `Session` is bound.
+
+        Note:
+            When a routing manager is set and no additional keyword arguments
+            are provided, the engine suggested for a given mapper and operation
+            mode (i.e. read or write) is cached for the lifetime of the
+            session, so that the routing manager is consulted only once per
+            mapper and operation mode. The cache is cleared when the session
+            routing is reassigned.
         """
         # Handle custom routing logic based on the router attribute
         if self.bind is not None:
             return self.bind
-        if self.routing is not None:
-            # Retrieve resource type
-            resource = mapper.class_ if isinstance(mapper, Mapper) else mapper
-            # Check if the session is flushing (i.e. committing)
-            if self._flushing:
-                # Use the write engine for flushing operations
-                engine = self.routing.get_write_engine(
-                    resource, async_mode=self.async_mode, **kwargs
-                )
+        if self._routing is not None:
+            # Only cache the routing suggestion when no additional arguments
+            # such as the clause or bind are forwarded to the routing manager.
+            if kwargs:
+                engine = self._route_bind(mapper, **kwargs)
             else:
-                # Use the read engine for all other operations
-                engine = self.routing.get_read_engine(
-                    resource, async_mode=self.async_mode, **kwargs
-                )
-            # Try the default engine if no suggestion is made
-            if engine is None:
-                engine = self.routing.get_engine(
-                    resource, async_mode=self.async_mode, **kwargs
-                )
-            # Finally return the engine if a suggestion is made
+                # Check if the session is flushing (i.e. committing)
+                key = (self._flushing, mapper)
+                engine = self._bind_cache.get(key)
+                if engine is None:
+                    engine = self._route_bind(mapper)
+                    if engine is not None:
+                        self._bind_cache[key] = engine
             if engine is not None:
-                if isinstance(engine, AsyncEngine):
-                    return engine.sync_engine
                 return engine
         # Fallback to default behavior
         return super().get_bind(mapper, *args, **kwargs)
 
-    @contextmanager
+    def _route_bind(
+        self,
+        mapper: Mapper[_T] | type[_T] | None = None,
+        **kwargs: Any,
+    ) -> Engine | None:
+        """Resolve the engine suggested by the routing for the given mapper."""
+        assert self._routing is not None
+        # Retrieve resource type
+        resource = mapper.class_ if isinstance(mapper, Mapper) else mapper
+        async_mode = self.proxy is not None
+        # Check if the session is flushing (i.e. committing)
+        if self._flushing:
+            # Use the write engine for flushing operations
+            engine = self._get_write_engine(
+                resource, async_mode=async_mode, **kwargs
+            )
+        else:
+            # Use the read engine for all other operations
+            engine = self._get_read_engine(
+                resource, async_mode=async_mode, **kwargs
+            )
+        # Try the default engine if no suggestion is made
+        if engine is None:
+            engine = self._get_engine(
+                resource, async_mode=async_mode, **kwargs
+            )
+        # Finally return the engine if a suggestion is made
+        if isinstance(engine, AsyncEngine):
+            return engine.sync_engine
+        return engine
+
     def bulk(
         self, *, proxy_reference: bool = True,
-    ) -> Generator['SessionBulk', None, None]:
+    ) -> '_SessionBulkContext':
         """A session bulk context manager for `Session` objects.
 
         The proxy option indicates that the provided resource references should
@@ -325,14 +416,9 @@ class Session(_Session):
                 be encapsulated with a proxy or not. Defaults to ``True``.
 
         Returns:
-            A `SessionBulk` instance.
+            A context manager yielding a `SessionBulk` instance.
         """
-        bulk = SessionBulk(self, proxy_reference=proxy_reference)
-        token = SESSION_BULK_CONTEXT.set(bulk)
-        try:
-            yield bulk
-        finally:
-            SESSION_BULK_CONTEXT.reset(token)
+        return _SessionBulkContext(self, proxy_reference)
 
     def commit(self, *, expire: bool | None = None) -> None:
         """Flush pending changes and commit the current transaction.
@@ -345,8 +431,16 @@ class Session(_Session):
         """
         if expire is None:
             return super().commit()
-        with set_expire_on_commit(expire, session=self):
+        # Swap the expire on commit flag directly, without going through the
+        # context manager.
+        expire_on_commit = self.expire_on_commit
+        if expire_on_commit == expire:
+            return super().commit()
+        self.expire_on_commit = expire
+        try:
             return super().commit()
+        finally:
+            self.expire_on_commit = expire_on_commit
 
 
 class SessionBulk(Bulk[Session]):
@@ -394,14 +488,40 @@ class SessionBulk(Bulk[Session]):
             raise_errors=raise_errors, scope=scope, strategy=strategy
         )
 
+        execute = self.session.execute
+        send = resolver.send
         try:
             context = next(resolver)
-            while True:
-                fields, statement = context
-                result = self.session.execute(statement)
-                context = resolver.send((fields, result))
-        except StopIteration:
-            pass
+            while context is not None:
+                signatures, statement = context
+                result = execute(statement)
+                context = send((signatures, result))
+        finally:
+            resolver.close()
+
+
+class _SessionBulkContext:
+    """A session bulk context manager.
+
+    It creates a new `SessionBulk` instance on entry and sets it as the
+    current session bulk until exit.
+    """
+
+    __slots__ = ('proxy_reference', 'session', 'token')
+
+    def __init__(self, session: Session, proxy_reference: bool) -> None:
+        self.session = session
+        self.proxy_reference = proxy_reference
+
+    def __enter__(self) -> SessionBulk:
+        bulk = SessionBulk(
+            self.session, proxy_reference=self.proxy_reference
+        )
+        self.token = SESSION_BULK_CONTEXT.set(bulk)
+        return bulk
+
+    def __exit__(self, *args: Any) -> None:
+        SESSION_BULK_CONTEXT.reset(self.token)
 
 
 # MARK: Factories
@@ -441,7 +561,9 @@ def async_session_factory(
         An `AsyncSessionFactory` instance for creating `AsyncSession` objects.
 
     Note: All other keyword arguments are passed to the constructor of the
-        parent SQLAlchemy `async_sessionmaker` class.
+        parent SQLAlchemy `async_sessionmaker` class. Establishing connections
+        requires a running event loop, use the `async_prewarm_engine` function
+        to fill the connection pool of the bound `AsyncEngine`.
     """
     # Build session factory
     factory = _async_sessionmaker(
@@ -467,6 +589,7 @@ def session_factory(
     autoflush: bool = True,
     expire_on_commit: bool = True,
     info: dict[Any, Any] | None = None,
+    prewarm: int = 0,
     **kwargs: Any,
 ) -> SessionFactory:
     """Create a sync session factory for `Session` objects.
@@ -486,6 +609,9 @@ def session_factory(
             Defaults to ``True``.
         info: An optional dictionary of arbitrary data to be associated with
             this session. Defaults to ``None``.
+        prewarm: The number of connections to establish in the connection
+            pool of the provided `Engine` before returning the factory, see
+            the `prewarm_engine` function. Defaults to ``0``.
 
     Returns:
         A `SessionFactory` instance for creating `Session` objects.
@@ -504,6 +630,9 @@ def session_factory(
         info=info,
         **kwargs,
     )
+    # Fill the engine connection pool if requested
+    if prewarm > 0 and isinstance(bind, Engine):
+        prewarm_engine(bind, prewarm)
     # Wrap the factory in a scoped session manager if requested. The scoped
     # session factory ensures that the session is thread-safe.
     return _scoped_session(factory) if scoped else factory
@@ -511,6 +640,26 @@ def session_factory(
 
 # MARK: Context Managers
 
+ASYNC_SESSION_FINALIZERS: dict[
+    str, Callable[['AsyncSession', bool | None], Awaitable[None]]
+] = {
+    'commit': lambda session, expire: session.commit(expire=expire),
+    'flush': lambda session, expire: session.flush(),
+    'rollback': lambda session, expire: session.rollback(),
+}
+"""The async session finalizers indexed by session manager exit action."""
+
+
+SESSION_FINALIZERS: dict[
+    str, Callable[['Session', bool | None], None]
+] = {
+    'commit': lambda session, expire: session.commit(expire=expire),
+    'flush': lambda session, expire: session.flush(),
+    'rollback': lambda session, expire: session.rollback(),
+}
+"""The sync session finalizers indexed by session manager exit action."""
+
+
 @asynccontextmanager
 async def async_session_manager(
     *,
@@ -555,21 +704,17 @@ async def async_session_manager(
     """
     session = SESSION_CONTEXT.get()
 
-    # Helper function to finalize the session
-    async def finalize(_session: AsyncSession) -> None:
-        if on_exit == 'commit':
-            await _session.commit(expire=expire)
-        elif on_exit == 'flush':
-            await _session.flush()
-        elif on_exit == 'rollback':
-            await _session.rollback()
+    # Resolve session finalizer
+    finalize = ASYNC_SESSION_FINALIZERS.get(on_exit) \
+        if on_exit is not None else None
 
     # Retrieve session
     if new is False:
         if session is not None:
             if isinstance(session, AsyncSession):
                 yield session
-                await finalize(session)
+                if finalize is not None:
+                    await finalize(session, expire)
                 return
             raise RuntimeError(
                 f"Invalid session type found in the current context. Expected "
@@ -582,10 +727,8 @@ async def async_session_manager(
             )
 
     # Retrieve factory
-    factory: AsyncSessionFactory | None = None
-    if using is not None:
-        factory = using
-    else:
+    factory: AsyncSessionFactory | None = using
+    if factory is None:
         app = PLATEFORME_CONTEXT.get()
         if app is not None:
             factory = app.async_session
@@ -603,13 +746,16 @@ async def async_session_manager(
     try:
         yield session
     except Exception as error:
-        await session.rollback()
+        if session.in_transaction():
+            await session.rollback()
         raise error
     else:
-        await finalize(session)
+        if finalize is not None:
+            await finalize(session, expire)
     finally:
         SESSION_CONTEXT.reset(token)
-        if isinstance(factory, _async_scoped_session):
+        if type(factory) is _async_scoped_session \
+                or isinstance(factory, _async_scoped_session):
             await factory.remove()
         else:
             await session.close()
@@ -659,21 +805,17 @@ def session_manager(
     """
     session = SESSION_CONTEXT.get()
 
-    # Helper function to finalize the session
-    def finalize(_session: Session) -> None:
-        if on_exit == 'commit':
-            _session.commit(expire=expire)
-        elif on_exit == 'flush':
-            _session.flush()
-        elif on_exit == 'rollback':
-            _session.rollback()
+    # Resolve session finalizer
+    finalize = SESSION_FINALIZERS.get(on_exit) \
+        if on_exit is not None else None
 
     # Retrieve session
     if new is False:
         if session is not None:
             if isinstance(session, Session):
                 yield session
-                finalize(session)
+                if finalize is not None:
+                    finalize(session, expire)
                 return
             raise RuntimeError(
                 f"Invalid session type found in the current context. Expected "
@@ -686,10 +828,8 @@ def session_manager(
             )
 
     # Retrieve factory
-    factory: SessionFactory | None
-    if using is not None:
-        factory = using
-    else:
+    factory: SessionFactory | None = using
+    if factory is None:
         app = PLATEFORME_CONTEXT.get()
         if app is not None:
             factory = app.session
@@ -707,13 +847,16 @@ def session_manager(
     try:
         yield session
     except Exception as error:
-        session.rollback()
+        if session.in_transaction():
+            session.rollback()
         raise error
     else:
-        finalize(session)
+        if finalize is not None:
+            finalize(session, expire)
     finally:
         SESSION_CONTEXT.reset(token)
-        if isinstance(factory, _scoped_session):
+        if type(factory) is _scoped_session \
+                or isinstance(factory, _scoped_session):
             factory.remove()
         else:
             session.close()
@@ -734,14 +877,61 @@ def set_expire_on_commit(
             "No session available in the current context. A valid session "
             "instance must be provided."
         )
-    if hasattr(session, 'sync_session'):
-        session = getattr(session, 'sync_session')
+    session = getattr(session, 'sync_session', session)
 
     # Handle expire on commit
     assert isinstance(session, _Session)
     session_expire_on_commit = session.expire_on_commit
+    if session_expire_on_commit == value:
+        yield
+        return
     session.expire_on_commit = value
     try:
         yield
     finally:
         session.expire_on_commit = session_expire_on_commit
+
+
+async def async_prewarm_engine(engine: AsyncEngine, size: int) -> None:
+    """Fill the connection pool of an async engine with new connections.
+
+    The connections are established concurrently, then all returned to the
+    connection pool, so that the first sessions bound to the engine do not
+    wait for new connections to be established.
+
+    Args:
+        engine: The `AsyncEngine` whose connection pool should be filled.
+        size: The number of connections to establish. It should not exceed
+            the engine connection pool capacity.
+    """
+    connections = await asyncio.gather(
+        *(engine.connect() for _ in range(size)),
+        return_exceptions=True,
+    )
+    errors = [conn for conn in connections if isinstance(conn, BaseException)]
+    for conn in connections:
+        if isinstance(conn, AsyncConnection):
+            await conn.close()
+    if errors:
+        raise errors[0]
+
+
+def prewarm_engine(engine: Engine, size: int) -> None:
+    """Fill the connection pool of an engine with new connections.
+
+    The connections are all checked out, then returned to the connection pool,
+    so that the first sessions bound to the engine do not wait for new
+    connections to be established.
+
+    Args:
+        engine: The `Engine` whose connection pool should be filled.
+        size: The number of connections to establish. It should not exceed
+            the engine connection pool capacity.
+    """
+    connections: list[Connection] = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    finally:
+        for conn in connections:
+            conn.close()
@@ -11,12 +11,14 @@ framework. Those classes can be used to handle exceptions and errors that may
 occur during the execution of the framework.
 """
 
-from typing import Any, Literal, Self
+import typing
+from typing import Any, ClassVar, Literal
 
 from ..framework import URL
 
 __all__ = (
     'ERROR_CODES',
+    'ERROR_CODES_SET',
     'BaseError',
     # Framework
     'AuthenticationError',
@@ -87,6 +89,10 @@ ERROR_CODES = Literal[
 documentation url for specific errors."""
 
 
+ERROR_CODES_SET: frozenset[str] = frozenset(typing.get_args(ERROR_CODES))
+"""The set of all Plateforme error codes for runtime validation."""
+
+
 # MARK: Base Error
 
 class BaseError(Exception):
@@ -98,17 +104,24 @@ class BaseError(Exception):
     code: str | None
     """The error code associated with the error."""
 
-    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
-        if cls is BaseError:
-            raise TypeError("Base error cannot be directly instantiated.")
-        return super().__new__(cls, *args, **kwargs)
+    __error_url__: ClassVar[str]
+    """The documentation URL of the error kind, computed once per class."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not hasattr(cls, 'code'):
+            raise TypeError(
+                f"Base error subclass {cls.__qualname__!r} must have a code "
+                f"attribute set."
+            )
+        cls.__error_url__ = f'{URL.ERRORS}/{getattr(cls, "kind", None)}'
 
     def __init__(self, *args: Any) -> None:
         """Initialize a new base error."""
-        if len(args) == 0:
+        if not args:
             raise TypeError("Base error must have a message.")
-        if not hasattr(self, 'code'):
-            raise TypeError("Base error must have a code attribute set.")
+        if type(self) is BaseError:
+            raise TypeError("Base error cannot be directly instantiated.")
         super().__init__(*args)
 
     def message(self) -> str:
@@ -120,10 +133,10 @@ class BaseError(Exception):
 
     def url(self) -> str:
         """Return the URL for the error."""
-        url = f'{URL.ERRORS}/{self.kind}'
-        if self.code is not None:
-            url += f'#{self.code}'
-        return url
+        code = self.code
+        if code is None:
+            return self.__error_url__
+        return f'{self.__error_url__}#{code}'
 
     def __str__(self) -> str:
         """Return a string representation of the error."""
@@ -164,6 +177,7 @@ class PlateformeError(BaseError):
     """Raised when a user error occurs within the framework."""
 
     kind = 'user'
+    code = None
 
     def __init__(
         self,
@@ -171,6 +185,8 @@ class PlateformeError(BaseError):
         code: ERROR_CODES | None = None,
     ) -> None:
         """Initialize a new Plateforme with an optional error code."""
+        if code is not None and code not in ERROR_CODES_SET:
+            raise ValueError(f"Invalid Plateforme error code {code!r}.")
         self.code = code
         super().__init__(*args)
 
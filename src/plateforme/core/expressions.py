@@ -567,6 +567,37 @@ class Filter(FilterDict):
 
     def __init__(
         self, *criteria: FilterDict, **update: FilterValue | str
+    ) -> None:
+        """Initialize the filter object with the given criteria and updates."""
+        self._initialize(criteria, update)
+
+    @classmethod
+    def from_criteria(
+        cls,
+        *criteria: FilterDict,
+        update: Mapping[str, FilterValue | str] | None = None,
+    ) -> Self:
+        """Create a filter object from the given criteria and update mapping.
+
+        This is equivalent to the filter constructor, but takes the updates
+        as a mapping, avoiding to expand them into keyword arguments.
+
+        Args:
+            *criteria: The filter criteria dictionaries to merge.
+            update: The filter criteria updates, where string values are
+                parsed as raw filter criteria. Defaults to ``None``.
+
+        Returns:
+            The filter object with the merged criteria and updates.
+        """
+        obj = cls.__new__(cls)
+        obj._initialize(criteria, update or {})
+        return obj
+
+    def _initialize(
+        self,
+        criteria: Sequence[FilterDict],
+        update: Mapping[str, FilterValue | str],
     ) -> None:
         """Initialize the filter object with the given criteria and updates."""
         # Merge filter criteria
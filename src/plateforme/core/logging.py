@@ -22,8 +22,9 @@ from datetime import datetime, timezone
 from enum import StrEnum
 from logging.config import dictConfig as buildConfig
 from logging.handlers import QueueHandler, QueueListener
-from queue import Queue
-from typing import Any
+from operator import attrgetter
+from queue import SimpleQueue
+from typing import Any, Callable
 
 from typing_extensions import override
 
@@ -45,6 +46,8 @@ __all__ = (
     'StreamHandler',
     # Utilities
     'COLOR_MAP',
+    'LOG_FORMATTER_MAP',
+    'LOG_HANDLER_MAP',
     'LOG_RECORD_MAP',
     'Color',
     'supports_ansi_colors',
@@ -77,26 +80,17 @@ def setup_logging(settings: 'LoggingSettings | None' = None) -> None:
 
         formatter_dump = formatter.model_dump(exclude={'type_', 'cls'})
 
-        if formatter.type_ == 'custom':
+        if formatter.type_ == 'simple':
             settings_formatters[key] = {
-                '()': formatter.cls,
-                'fmt_keys': formatter_dump,
-            }
-        elif formatter.type_ == 'default':
-            settings_formatters[key] = {
-                '()': 'plateforme.logging.DefaultFormatter',
-                'fmt_keys': formatter_dump,
+                to_camel_case(key): value
+                for key, value in formatter_dump.items()
             }
-        elif formatter.type_ == 'json':
+        else:
             settings_formatters[key] = {
-                '()': 'plateforme.logging.JsonFormatter',
+                '()': formatter.cls if formatter.type_ == 'custom'
+                    else LOG_FORMATTER_MAP[formatter.type_],
                 'fmt_keys': formatter_dump,
             }
-        elif formatter.type_ == 'simple':
-            settings_formatters[key] = {
-                to_camel_case(key): value
-                for key, value in formatter_dump.items()
-            }
 
     # Resolve handlers settings
     settings_handlers: dict[str, Any] = {}
@@ -108,10 +102,8 @@ def setup_logging(settings: 'LoggingSettings | None' = None) -> None:
             )
 
         handler_dump = handler.model_dump(exclude={'type_'})
-        if handler.type_ == 'file':
-            handler_dump['class'] = 'plateforme.logging.FileHandler'
-        if handler.type_ == 'stream':
-            handler_dump['class'] = 'plateforme.logging.StreamHandler'
+        if handler.type_ in LOG_HANDLER_MAP:
+            handler_dump['class'] = LOG_HANDLER_MAP[handler.type_]
 
         settings_handlers[key] = {
             to_camel_case(key): value
@@ -132,12 +124,20 @@ def setup_logging(settings: 'LoggingSettings | None' = None) -> None:
         },
     })
 
-    handlers: list[logging.Handler] = []
-    for name in settings_handlers.keys():
-        handlers.append(logging._handlers.get(name))  # type: ignore
+    # Retrieve configured handlers, using the public accessor when available
+    # (Python 3.12+) and falling back to the logging handlers registry.
+    get_handler = getattr(logging, 'getHandlerByName', None) \
+        or logging._handlers.get  # type: ignore[attr-defined]
+    handlers: list[logging.Handler] = [
+        get_handler(name) for name in settings_handlers.keys()
+    ]
 
-    queue = Queue(maxsize=-1)  # type: ignore
+    queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
     queue_handler = QueueHandler(queue)
+    # Drop records that no handler would emit before they are prepared and
+    # enqueued, as the listener respects the handler levels.
+    if handlers:
+        queue_handler.setLevel(min(handler.level for handler in handlers))
 
     root_logger = logging.getLogger()
     root_logger.addHandler(queue_handler)
@@ -156,6 +156,7 @@ class DefaultFormatter(logging.Formatter):
         include: tuple[str, ...]
         asctime: bool
         use_colors: bool
+        level_prefixes: dict[str, str]
 
     def __init__(
         self, *, fmt_keys: dict[str, bool] | None = None,
@@ -163,29 +164,41 @@ class DefaultFormatter(logging.Formatter):
         """Initialize the default log formatter."""
         super().__init__()
 
-        fmt_keys = fmt_keys.copy() if fmt_keys else {}
-        self.asctime = fmt_keys.pop('asctime', False)
-        self.use_colors = fmt_keys.pop('use_colors', False) \
+        fmt_keys = fmt_keys or {}
+        self.asctime = fmt_keys.get('asctime', False)
+        self.use_colors = fmt_keys.get('use_colors', False) \
             and supports_ansi_colors()
 
+        # Precompute the log level prefixes
+        self.level_prefixes = {
+            levelname: self.format_levelname(levelname)
+            for levelname in COLOR_MAP
+        }
+
     @override
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as a text string."""
-        color_start = COLOR_MAP.get(record.levelname, Color.RESET)
-        color_end = Color.RESET
+        prefix = self.level_prefixes.get(record.levelname)
+        if prefix is None:
+            prefix = self.format_levelname(record.levelname)
+            self.level_prefixes[record.levelname] = prefix
 
-        message = ''
         if self.asctime:
-            message = f'[{record.asctime}] '
-        if self.use_colors:
-            levelname = f'{color_start}{record.levelname}{color_end}:'
-            message += levelname.ljust(len(color_start + color_end) + 10)
-        else:
-            levelname = f'{record.levelname}:'
-            message += levelname.ljust(10)
-        message += f'{record.module}:{record.lineno} - {record.message}'
+            record.asctime = self.formatTime(record)
+            prefix = f'[{record.asctime}] {prefix}'
 
-        return message
+        record.message = record.getMessage()
+
+        return f'{prefix}{record.module}:{record.lineno} - {record.message}'
+
+    def format_levelname(self, levelname: str) -> str:
+        """Format the padded log level prefix of the given level name."""
+        if self.use_colors:
+            color_start = COLOR_MAP.get(levelname, Color.RESET)
+            color_end = Color.RESET
+            prefix = f'{color_start}{levelname}{color_end}:'
+            return prefix.ljust(len(color_start + color_end) + 10)
+        return f'{levelname}:'.ljust(10)
 
 class JsonFormatter(logging.Formatter):
     """A JSON log formatter."""
@@ -193,6 +206,8 @@ class JsonFormatter(logging.Formatter):
     if typing.TYPE_CHECKING:
         include: tuple[str, ...]
         extra: bool
+        accessors: tuple[tuple[str, Callable[[logging.LogRecord], Any]], ...]
+        timestamp_cache: tuple[int, str]
 
     def __init__(
         self, *, fmt_keys: dict[str, bool] | None = None,
@@ -200,11 +215,30 @@ class JsonFormatter(logging.Formatter):
         """Initialize the JSON log formatter."""
         super().__init__()
 
-        fmt_keys = fmt_keys.copy() if fmt_keys else {}
-        self.extra = fmt_keys.pop('extra', True)
-        self.include = tuple(dict.fromkeys([
-            key for key, value in fmt_keys.items() if value is True
-        ]))
+        fmt_keys = fmt_keys or {}
+        self.extra = fmt_keys.get('extra', True)
+        self.include = tuple(
+            key for key, value in fmt_keys.items()
+            if value is True and key != 'extra'
+        )
+
+        self.timestamp_cache = (-1, '')
+
+        # Precompute the log record accessors of the included keys
+        special_accessors: dict[str, Callable[[logging.LogRecord], Any]] = {
+            'message': self.get_message,
+            'timestamp': self.get_timestamp,
+            'exc_info': self.get_exc_info,
+            'stack_info': self.get_stack_info,
+        }
+        self.accessors = tuple(
+            (
+                key,
+                special_accessors.get(key)
+                or attrgetter(LOG_RECORD_MAP[key]),
+            )
+            for key in self.include
+        )
 
     @override
     def format(self, record: logging.LogRecord) -> str:
@@ -214,22 +248,9 @@ class JsonFormatter(logging.Formatter):
 
     def validate(self, record: logging.LogRecord) -> dict[str, Any]:
         """Validate the log record as a JSON-serializable dictionary."""
-        message: dict[str, Any] = {}
-
-        for key in self.include:
-            if key == 'message':
-                message[key] = record.getMessage()
-            elif key == 'timestamp':
-                message[key] = datetime.fromtimestamp(
-                    record.created,
-                    tz=timezone.utc
-                ).isoformat()
-            elif key == 'exc_info' and record.exc_info is not None:
-                message[key] = self.formatException(record.exc_info)
-            elif key == 'stack_info' and record.stack_info is not None:
-                message[key] = self.formatStack(record.stack_info)
-            else:
-                message[key] = getattr(record, LOG_RECORD_MAP[key])
+        message: dict[str, Any] = {
+            key: accessor(record) for key, accessor in self.accessors
+        }
 
         if self.extra:
             for key, val in record.__dict__.items():
@@ -239,6 +260,45 @@ class JsonFormatter(logging.Formatter):
 
         return message
 
+    def get_message(self, record: logging.LogRecord) -> str:
+        """Get the log record message."""
+        return record.getMessage()
+
+    def get_timestamp(self, record: logging.LogRecord) -> str:
+        """Get the log record creation time as an ISO formatted string.
+
+        The formatted date and time up to the seconds is cached, so that only
+        the microseconds are formatted for records created within the same
+        second.
+        """
+        seconds = int(record.created)
+        microseconds = round((record.created - seconds) * 1e6)
+        if microseconds >= 1_000_000:
+            seconds += 1
+            microseconds -= 1_000_000
+
+        cache_seconds, prefix = self.timestamp_cache
+        if cache_seconds != seconds:
+            prefix = datetime.fromtimestamp(seconds, tz=timezone.utc) \
+                .strftime('%Y-%m-%dT%H:%M:%S')
+            self.timestamp_cache = (seconds, prefix)
+
+        if microseconds:
+            return f'{prefix}.{microseconds:06d}+00:00'
+        return f'{prefix}+00:00'
+
+    def get_exc_info(self, record: logging.LogRecord) -> Any:
+        """Get the log record formatted exception information."""
+        if record.exc_info is not None:
+            return self.formatException(record.exc_info)
+        return None
+
+    def get_stack_info(self, record: logging.LogRecord) -> str | None:
+        """Get the log record formatted stack information."""
+        if record.stack_info is not None:
+            return self.formatStack(record.stack_info)
+        return None
+
 
 # MARK: Handlers
 
@@ -309,6 +369,20 @@ COLOR_MAP = {
 """The color map for log levels."""
 
 
+LOG_FORMATTER_MAP = {
+    'default': 'plateforme.logging.DefaultFormatter',
+    'json': 'plateforme.logging.JsonFormatter',
+}
+"""The built-in log formatter classes mapping by formatter type."""
+
+
+LOG_HANDLER_MAP = {
+    'file': 'plateforme.logging.FileHandler',
+    'stream': 'plateforme.logging.StreamHandler',
+}
+"""The built-in log handler classes mapping by handler type."""
+
+
 LOG_RECORD_MAP = {
     'args': 'args',
     'asctime': 'asctime',
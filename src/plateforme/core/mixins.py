@@ -16,6 +16,7 @@ __all__ = (
 )
 
 from datetime import datetime, timezone
+from functools import partial
 
 from .schema.fields import Field
 
@@ -60,7 +61,7 @@ class Auditable:
     """
 
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=partial(datetime.now, timezone.utc),
         title="Created at",
         description="Date and time the resource was created.",
         examples=["2023-01-01T00:00:00Z"],
@@ -69,7 +70,7 @@ class Auditable:
     )
 
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=partial(datetime.now, timezone.utc),
         title="Updated at",
         description="Date and time the resource was last updated.",
         examples=["2023-01-01T00:00:00Z"],
@@ -12,6 +12,7 @@ expressions within the Plateforme framework.
 
 import re
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, Callable, Literal
 
 from .typing import Deferred
@@ -541,6 +542,7 @@ def pluralize(string: str) -> str:
     return string + 's'
 
 
+@lru_cache(maxsize=256)
 def to_camel_case(string: str) -> str:
     """Convert a string to camel case.
 
@@ -553,6 +555,10 @@ def to_camel_case(string: str) -> str:
     Examples:
         >>> to_camel_case('camel case example')
         'camelCaseExample'
+
+    Note:
+        The conversion results are cached, as it is typically applied to a
+        small set of recurring configuration keys.
     """
     s = string
     s = re.sub(r'[\s\-\_]', CHAR_SEP, s)
@@ -12,11 +12,12 @@ redirection of attribute access.
 """
 
 import typing
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from itertools import repeat
 from typing import Any, ClassVar, Generic, Protocol, TypeVar
 
 from .config import Configurable, ConfigurableMeta, ConfigWrapper
-from .patterns import match_any_pattern
 from .schema.fields import ConfigField
 from .typing import isbaseclass_lenient
 from .utils import get_meta_orig_bases
@@ -29,10 +30,16 @@ MANAGED_ATTRS = (
     r'__proxy__',
     r'__proxy_getattr__',
     r'__proxy_info__',
+    r'__proxy_read_only__',
     r'__proxy_target__',
     r'__proxy_type__',
 )
 
+_MANAGED_ATTRS: frozenset[str] = frozenset(MANAGED_ATTRS)
+"""The managed attributes as a set of literal names. All managed attributes
+are plain names, hence a set membership test is used instead of matching them
+as patterns on each attribute access."""
+
 _T = TypeVar('_T', bound=Any)
 
 __all__ = (
@@ -86,6 +93,72 @@ class ProxyProtocol(Protocol):
         ...
 
 
+# MARK: Utilities
+
+def _has_type_attr(cls: type, name: str) -> bool:
+    """Check whether an attribute name is defined along the class MRO.
+
+    It is used by the proxy classes to resolve whether an attribute access
+    should be looked up on the proxy instance or delegated to the proxy target
+    object without relying on a missed lookup raising an `AttributeError`.
+
+    Args:
+        cls: The class to look up the attribute name from.
+        name: The attribute name to look up.
+
+    Returns:
+        Whether the attribute name is defined within the class or one of its
+        bases namespace.
+
+    Note:
+        The class namespaces are looked up on each call and never cached, so
+        that attributes set or deleted later on any of the class bases,
+        including bases that are not proxy classes, are taken into account.
+    """
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return True
+    return False
+
+
+@lru_cache(maxsize=256)
+def _get_proxy_type(meta_bases: tuple[type[Any], ...]) -> type[Any] | None:
+    """Get the proxy target type from the proxy class original bases.
+
+    Args:
+        meta_bases: The original bases of the proxy class.
+
+    Returns:
+        The proxy target type or ``None`` if the generic argument of the proxy
+        base class is a type variable or not provided.
+
+    Raises:
+        TypeError: If the generic argument of the proxy base class is not a
+            strict type.
+
+    Note:
+        Results are cached per original bases tuple. Failed resolutions are
+        not cached and raise again on each call.
+    """
+    for meta_base in meta_bases:
+        origin = typing.get_origin(meta_base)
+        if origin is None:
+            continue
+        if not isbaseclass_lenient(origin, ('Proxy', 'CollectionProxy')):
+            continue
+        args = typing.get_args(meta_base)
+        if len(args) == 1:
+            if isinstance(args[0], TypeVar):
+                return None
+            if isinstance(args[0], type):
+                return args[0]
+        raise TypeError(
+            f"Generic argument for the `Proxy` and `CollectionProxy` "
+            f"classes must be a strict type. Got: {args}."
+        )
+    return None
+
+
 # MARK: Proxy Metaclass
 
 class ProxyMeta(ConfigurableMeta):
@@ -108,26 +181,8 @@ class ProxyMeta(ConfigurableMeta):
 
         # Collect the proxy target type from the original bases found within
         # the class namespace and the provided bases.
-        proxy_type: type[Any] | None = None
-
         meta_bases = get_meta_orig_bases(bases, namespace)
-        for meta_base in meta_bases:
-            origin = typing.get_origin(meta_base)
-            if origin is None:
-                continue
-            if not isbaseclass_lenient(origin, ('Proxy', 'CollectionProxy')):
-                continue
-            args = typing.get_args(meta_base)
-            if len(args) == 1:
-                if isinstance(args[0], TypeVar):
-                    break
-                if isinstance(args[0], type):
-                    proxy_type = args[0]
-                    break
-            raise TypeError(
-                f"Generic argument for the `Proxy` and `CollectionProxy` "
-                f"classes must be a strict type. Got: {args}."
-            )
+        proxy_type = _get_proxy_type(meta_bases)
 
         setattr(cls, '__proxy_type__', proxy_type)
 
@@ -139,7 +194,7 @@ class ProxyMeta(ConfigurableMeta):
     if not typing.TYPE_CHECKING:
         def __getattr__(cls, name: str) -> Any:
             # Check for managed attributes
-            if match_any_pattern(name, *MANAGED_ATTRS):
+            if name in _MANAGED_ATTRS:
                 raise AttributeError(
                     f"Cannot access attribute {name!r}. The attribute is "
                     f"managed by the proxy metaclass."
@@ -164,23 +219,32 @@ class Proxy(Configurable[ProxyConfig], Generic[_T], metaclass=ProxyMeta):
     Attributes:
         __config__: The configuration class for the proxy.
         __proxy_info__: Additional information about the proxy target object.
+        __proxy_read_only__: Whether the proxy is read-only, resolved from the
+            proxy configuration on initialization.
         __proxy_target__: The proxy target object.
         __proxy_type__: The type of the proxy target object.
     """
     if typing.TYPE_CHECKING:
         __config__: ClassVar[ProxyConfig]
+        __proxy_info__: Any | None
+        __proxy_read_only__: bool
+        __proxy_target__: _T | None
         __proxy_type__: ClassVar[type[Any] | None]
 
+    __slots__ = ('__proxy_info__', '__proxy_read_only__', '__proxy_target__')
+
     def __init__(
         self, target: _T | None = None, *, info: Any | None = None
     ) -> None:
         """Initialize a new proxy instance with a target object."""
-        self.__proxy_info__ = info
-        self.__proxy_target__ = target
+        object.__setattr__(self, '__proxy_info__', info)
+        read_only = bool(self.__config__.read_only)
+        object.__setattr__(self, '__proxy_read_only__', read_only)
+        object.__setattr__(self, '__proxy_target__', target)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Invoke the proxy target object."""
-        return self.__proxy__()(*args, **kwargs)
+        return object.__getattribute__(self, '__proxy__')()(*args, **kwargs)
 
     def __proxy__(self) -> _T:
         """Get the proxy target object."""
@@ -202,34 +266,35 @@ class Proxy(Configurable[ProxyConfig], Generic[_T], metaclass=ProxyMeta):
     if not typing.TYPE_CHECKING:
         def __getattribute__(self, name: str) -> Any:
             # Check for managed attributes
-            if match_any_pattern(name, *MANAGED_ATTRS):
+            if name in _MANAGED_ATTRS:
                 return object.__getattribute__(self, name)
+            # Delegate attributes that are neither defined on the proxy class
+            # nor on the proxy instance directly to the attribute getter.
+            if not _has_type_attr(type(self), name) \
+                    and name not in object.__getattribute__(self, '__dict__'):
+                return type(self).__getattr__(self, name)
             # Handle subclasses attribute overrides
-            return super(Proxy, self).__getattribute__(name)
+            return object.__getattribute__(self, name)
 
         def __getattr__(self, name: str) -> Any:
-            # Check for managed attributes
-            if match_any_pattern(name, *MANAGED_ATTRS):
+            # Check for managed attributes, reached when a managed attribute
+            # is not set, e.g. an unset proxy slot, to prevent recursing into
+            # the proxy target resolution.
+            if name in _MANAGED_ATTRS:
                 raise AttributeError(
                     f"Cannot access attribute {name!r}. The attribute is "
                     f"managed by the proxy class."
                 )
             # Proxy attribute access to the target object
-            proxy = object.__getattribute__(self, '__proxy__')
-            if not callable(proxy):
-                raise AttributeError(
-                    f"Cannot access attribute {name!r}. The proxy target is "
-                    f"not callable."
-                )
-            return getattr(proxy(), name)
+            return getattr(object.__getattribute__(self, '__proxy__')(), name)
 
     def __setattr__(self, name: str, value: Any) -> None:
         # Check for managed attributes
-        if match_any_pattern(name, *MANAGED_ATTRS):
+        if name in _MANAGED_ATTRS:
             object.__setattr__(self, name, value)
             return
         # Proxy attribute access to the target object
-        if self.__config__.read_only:
+        if object.__getattribute__(self, '__proxy_read_only__'):
             raise AttributeError(
                 f"Cannot set attribute {name!r}. The proxy is read-only."
             )
@@ -237,21 +302,21 @@ class Proxy(Configurable[ProxyConfig], Generic[_T], metaclass=ProxyMeta):
 
     def __delattr__(self, name: str) -> None:
         # Check for managed attributes
-        if match_any_pattern(name, *MANAGED_ATTRS):
+        if name in _MANAGED_ATTRS:
             object.__delattr__(self, name)
             return
         # Proxy attribute access to the target object
-        if self.__config__.read_only:
+        if object.__getattribute__(self, '__proxy_read_only__'):
             raise AttributeError(
                 f"Cannot delete attribute {name!r}. The proxy is read-only."
             )
         delattr(self.__proxy__(), name)
 
     def __repr__(self) -> str:
-        return repr(self.__proxy__())
+        return repr(object.__getattribute__(self, '__proxy__')())
 
     def __str__(self) -> str:
-        return str(self.__proxy__())
+        return str(object.__getattribute__(self, '__proxy__')())
 
 
 # MARK: Collection Proxy
@@ -266,38 +331,52 @@ class CollectionProxy(
     Attributes:
         __config__: The configuration class for the proxy.
         __proxy_info__: Additional information about the proxy target object.
+        __proxy_read_only__: Whether the proxy is read-only, resolved from the
+            proxy configuration on initialization.
         __proxy_target__: The proxy target object.
         __proxy_type__: The type of the proxy target objects.
     """
     if typing.TYPE_CHECKING:
         __config__: ClassVar[ProxyConfig]
+        __proxy_info__: Any | None
+        __proxy_read_only__: bool
+        __proxy_target__: list[_T] | None
         __proxy_type__: ClassVar[type[Any] | None]
 
+    __slots__ = ('__proxy_info__', '__proxy_read_only__', '__proxy_target__')
+
     def __init__(
         self, target: Iterable[_T] | None = None, *, info: Any | None = None
     ) -> None:
         """Initialize a new proxy instance with a target iterable object."""
-        self.__proxy_info__ = info
+        object.__setattr__(self, '__proxy_info__', info)
+        read_only = bool(self.__config__.read_only)
+        object.__setattr__(self, '__proxy_read_only__', read_only)
         # Check that all items in the target iterable are of the same type and
         # that they all have the same attribute name.
         if target is None:
-            self.__proxy_target__ = None
+            object.__setattr__(self, '__proxy_target__', None)
         else:
+            items = list(target)
             target_type = self.__proxy_type__
-            for item in target:
-                if not target_type:
-                    target_type = type(item)
-                elif not isinstance(item, target_type):
+            if not target_type and items:
+                target_type = type(items[0])
+            if target_type is not None:
+                for item in items:
+                    if type(item) is target_type \
+                            or isinstance(item, target_type):
+                        continue
                     raise TypeError(
                         f"Target items must all be of the same type. "
                         f"Expected {target_type.__name__!r}, got "
                         f"{type(item).__name__!r}."
                     )
-            self.__proxy_target__ = list(target)
+            object.__setattr__(self, '__proxy_target__', items)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Invoke the proxy target iterable object."""
-        return [item(*args, **kwargs) for item in self.__proxy__()]
+        proxy = object.__getattribute__(self, '__proxy__')
+        return [item(*args, **kwargs) for item in proxy()]
 
     def __proxy__(self) -> list[_T]:
         """Get the proxy target iterable object."""
@@ -319,29 +398,28 @@ class CollectionProxy(
     if not typing.TYPE_CHECKING:
         def __getattribute__(self, name: str) -> Any:
             # Check for managed attributes
-            if match_any_pattern(name, *MANAGED_ATTRS):
+            if name in _MANAGED_ATTRS:
                 return object.__getattribute__(self, name)
+            # Delegate attributes that are neither defined on the proxy class
+            # nor on the proxy instance directly to the attribute getter.
+            if not _has_type_attr(type(self), name) \
+                    and name not in object.__getattribute__(self, '__dict__'):
+                return type(self).__getattr__(self, name)
             # Handle subclasses attribute overrides
-            return super(CollectionProxy, self).__getattribute__(name)
+            return object.__getattribute__(self, name)
 
         def __getattr__(self, name: str) -> Any:
-            # Check for managed attributes
-            if match_any_pattern(name, *MANAGED_ATTRS):
+            # Check for managed attributes, reached when a managed attribute
+            # is not set, e.g. an unset proxy slot, to prevent recursing into
+            # the proxy target resolution.
+            if name in _MANAGED_ATTRS:
                 raise AttributeError(
                     f"Cannot access attribute {name!r}. The attribute is "
                     f"managed by the proxy class."
                 )
-            # Proxy attribute access to the target object
-            proxy = object.__getattribute__(self, '__proxy__')
-            if not callable(proxy):
-                raise AttributeError(
-                    f"Cannot access attribute {name!r}. The proxy target is "
-                    f"not callable."
-                )
             # Retrieve attribute from all proxy items
-            proxy_items = []
-            for item in proxy():
-                proxy_items.append(getattr(item, name))
+            proxy = object.__getattribute__(self, '__proxy__')
+            proxy_items = list(map(getattr, proxy(), repeat(name)))
             # Return a callable that calls the attribute on all proxy items if
             # the attribute from proxy is callable.
             if proxy_items and callable(proxy_items[0]):
@@ -352,11 +430,11 @@ class CollectionProxy(
 
     def __setattr__(self, name: str, value: Any) -> None:
         # Check for managed attributes
-        if match_any_pattern(name, *MANAGED_ATTRS):
+        if name in _MANAGED_ATTRS:
             object.__setattr__(self, name, value)
             return
         # Proxy attribute access to the target object
-        if self.__config__.read_only:
+        if object.__getattribute__(self, '__proxy_read_only__'):
             raise AttributeError(
                 f"Cannot set attribute {name!r}. The proxy is read-only."
             )
@@ -365,11 +443,11 @@ class CollectionProxy(
 
     def __delattr__(self, name: str) -> None:
         # Check for managed attributes
-        if match_any_pattern(name, *MANAGED_ATTRS):
+        if name in _MANAGED_ATTRS:
             object.__delattr__(self, name)
             return
         # Proxy attribute access to the target object
-        if self.__config__.read_only:
+        if object.__getattribute__(self, '__proxy_read_only__'):
             raise AttributeError(
                 f"Cannot delete attribute {name!r}. The proxy is read-only."
             )
@@ -377,8 +455,9 @@ class CollectionProxy(
             delattr(item, name)
 
     def __getitem__(self, index: int) -> _T:
-        proxy = self.__proxy__()
-        return proxy[index]
+        proxy: Callable[[], list[_T]] = \
+            object.__getattribute__(self, '__proxy__')
+        return proxy()[index]
 
     def __setitem__(self, index: int, value: _T) -> None:
         raise TypeError(
@@ -391,19 +470,23 @@ class CollectionProxy(
         )
 
     def __contains__(self, obj: object) -> bool:
-        return obj in self.__proxy__()
+        return obj in object.__getattribute__(self, '__proxy__')()
 
     def __iter__(self) -> Iterator[_T]:
-        yield from self.__proxy__()
+        proxy: Callable[[], list[_T]] = \
+            object.__getattribute__(self, '__proxy__')
+        return iter(proxy())
 
     def __reversed__(self) -> Iterator[_T]:
-        yield from reversed(self.__proxy__())
+        proxy: Callable[[], list[_T]] = \
+            object.__getattribute__(self, '__proxy__')
+        return proxy().__reversed__()
 
     def __len__(self) -> int:
-        return len(self.__proxy__())
+        return len(object.__getattribute__(self, '__proxy__')())
 
     def __repr__(self) -> str:
-        return repr(self.__proxy__())
+        return repr(object.__getattribute__(self, '__proxy__')())
 
     def __str__(self) -> str:
-        return str(self.__proxy__())
+        return str(object.__getattribute__(self, '__proxy__')())
@@ -44,6 +44,7 @@ Examples:
 
 import dataclasses
 import typing
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from ..modules import import_object
@@ -92,6 +93,15 @@ class LoaderInfo:
                 "when the loader is not initialized."
             )
 
+    def __hash__(self) -> int:
+        """Loader information hash.
+
+        The keyword arguments are hashed as a set of items, allowing loader
+        information to be hashed whenever its argument values are hashable.
+        """
+        kwargs = frozenset(self.kwargs.items()) if self.kwargs else None
+        return hash((self.path, self.init, self.args, kwargs))
+
     def load(
         self,
         *,
@@ -107,7 +117,7 @@ class LoaderInfo:
         Returns:
             The loaded object.
         """
-        instance = import_object(self.path)
+        instance = _import_object(self.path)
         if self.init:
             try:
                 args = self.args or ()
@@ -130,38 +140,66 @@ class LoaderInfo:
         source: Any,
         handler: GetCoreSchemaHandler,
     ) -> CoreSchema:
-        return core_schema.union_schema([
-            handler(source),
-            core_schema.no_info_after_validator_function(
-                lambda obj: LoaderInfo(**obj),
-                core_schema.typed_dict_schema({
-                    'path': core_schema.typed_dict_field(
-                        core_schema.str_schema(),
-                        required=True,
-                    ),
-                    'init': core_schema.typed_dict_field(
-                        core_schema.bool_schema(),
-                        required=True,
-                    ),
-                    'args': core_schema.typed_dict_field(
-                        core_schema.tuple_variable_schema(
-                            core_schema.any_schema()
-                        ),
-                        required=False,
-                    ),
-                    'kwargs': core_schema.typed_dict_field(
-                        core_schema.dict_schema(
-                            core_schema.str_schema(), core_schema.any_schema()
-                        ),
-                        required=False,
-                    ),
-                }),
-            ),
-            core_schema.no_info_after_validator_function(
-                lambda obj: LoaderInfo(path=obj),
-                core_schema.str_schema(),
+        # The string branch is tried first as loaders are mostly provided
+        # with their import path, the first matching branch being used.
+        return core_schema.union_schema(
+            [
+                _LOADER_INFO_PATH_SCHEMA,
+                handler(source),
+                _LOADER_INFO_DICT_SCHEMA,
+            ],
+            mode='left_to_right',
+        )
+
+
+_LOADER_INFO_PATH_SCHEMA = core_schema.no_info_after_validator_function(
+    lambda obj: LoaderInfo(path=obj),
+    core_schema.str_schema(),
+)
+"""The loader information schema for an import path string."""
+
+_LOADER_INFO_DICT_SCHEMA = core_schema.no_info_after_validator_function(
+    lambda obj: LoaderInfo(**obj),
+    core_schema.typed_dict_schema({
+        'path': core_schema.typed_dict_field(
+            core_schema.str_schema(),
+            required=True,
+        ),
+        'init': core_schema.typed_dict_field(
+            core_schema.bool_schema(),
+            required=True,
+        ),
+        'args': core_schema.typed_dict_field(
+            core_schema.tuple_variable_schema(core_schema.any_schema()),
+            required=False,
+        ),
+        'kwargs': core_schema.typed_dict_field(
+            core_schema.dict_schema(
+                core_schema.str_schema(), core_schema.any_schema()
             ),
-        ])
+            required=False,
+        ),
+    }),
+)
+"""The loader information schema for a dictionary of loader fields."""
+
+
+@lru_cache(maxsize=512)
+def _import_object(path: str) -> Any:
+    """Import an object from its full path.
+
+    Args:
+        path: The full path to the object to import.
+
+    Returns:
+        The imported object.
+
+    Note:
+        The imported objects are cached, as the same loader paths are
+        typically validated many times across settings and model rebuilds.
+        Only the import is cached, initialized objects are never shared.
+    """
+    return import_object(path)
 
 
 class LoaderProxy(Proxy[_T]):
@@ -170,6 +208,8 @@ class LoaderProxy(Proxy[_T]):
     if typing.TYPE_CHECKING:
         __proxy_info__: LoaderInfo
 
+    __slots__ = ()
+
     def __init__(self, obj: _T, *, info: LoaderInfo) -> None:
         """Initialize the loader proxy."""
         super().__init__(obj, info=info)
@@ -178,7 +218,7 @@ class LoaderProxy(Proxy[_T]):
         core_schema.any_schema(
             serialization=core_schema.plain_serializer_function_ser_schema(
                 lambda obj, info: obj if info.mode == 'python' \
-                    else getattr(obj, '__proxy_info__', {}),
+                    else object.__getattribute__(obj, '__proxy_info__'),
                 info_arg=True,
                 when_used='always',
             )
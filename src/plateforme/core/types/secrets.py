@@ -61,6 +61,7 @@ def _secret_serialization(
 class BaseSecret(BaseType, Generic[_T]):
     """A base secret for storing sensitive information."""
     if typing.TYPE_CHECKING:
+        __secret_schema__: ClassVar[CoreSchema]
         _schema: ClassVar[CoreSchema | None]
         _schema_type: ClassVar[str | None]
 
@@ -93,6 +94,13 @@ class BaseSecret(BaseType, Generic[_T]):
         source: type[Any],
         handler: GetCoreSchemaHandler,
     ) -> CoreSchema:
+        # Reuse the core schema already built for the secret type, as it does
+        # not depend on the source when the inner schema is fixed.
+        cached_schema: CoreSchema | None = \
+            cls.__dict__.get('__secret_schema__')
+        if cached_schema is not None and source is cls:
+            return cached_schema
+
         inner_schema = getattr(cls, '_schema', None)
         if inner_schema is None:
             inner_type = None
@@ -151,11 +159,14 @@ class BaseSecret(BaseType, Generic[_T]):
                 ),
             )
 
-        return core_schema.lax_or_strict_schema(
+        schema = core_schema.lax_or_strict_schema(
             lax_schema=get_secret_schema(strict=False),
             strict_schema=get_secret_schema(strict=True),
             metadata={'pydantic_js_functions': [get_json_schema]},
         )
+        if source is cls and getattr(cls, '_schema', None) is not None:
+            cls.__secret_schema__ = schema
+        return schema
 
     @classmethod
     def __get_sqlalchemy_data_type__(
@@ -105,8 +105,10 @@ from .core.database.sessions import (
     AsyncSessionFactory,
     Session,
     SessionFactory,
+    async_prewarm_engine,
     async_session_factory,
     async_session_manager,
+    prewarm_engine,
     session_factory,
     session_manager,
     set_expire_on_commit,
@@ -251,11 +253,13 @@ __all__ = (
     # Sessions (async)
     'AsyncSession',
     'AsyncSessionFactory',
+    'async_prewarm_engine',
     'async_session_factory',
     'async_session_manager',
     # Sessions (sync)
     'Session',
     'SessionFactory',
+    'prewarm_engine',
     'session_factory',
     'session_manager',
     # Sessions (utilities)
@@ -12,6 +12,8 @@ and repository information.
 
 import typing
 from enum import StrEnum
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Literal
 
 __all__ = (
@@ -39,10 +41,32 @@ VERSION = '0.1.0-a3'
 """The version of the Plateforme framework."""
 
 
+_VERSION_PARTS = VERSION.split('.')
+_VERSION_MAJOR = '.'.join(_VERSION_PARTS[:1])
+_VERSION_MINOR = '.'.join(_VERSION_PARTS[:2])
+_VERSION_PATCH = '.'.join(_VERSION_PARTS[:3])
+
+_RELATED_PACKAGES = frozenset({
+    'alembic',
+    'fastapi',
+    'mypy',
+    'pydantic',
+    'pydantic_core',
+    'pydantic-extra-types',
+    'pydantic-settings',
+    'pyright',
+    'sqlalchemy',
+    'starlette',
+    'typing_extensions',
+    'uvicorn',
+})
+"""The packages that are closely related to Plateforme, use Plateforme or
+often conflict with Plateforme framework."""
+
+
+@lru_cache(maxsize=1)
 def package_dir() -> str:
     """The Plateforme framework site package directory."""
-    from pathlib import Path
-
     path = Path(__file__).parents[1].absolute()
     if path.name == 'src':
         path = path.parent
@@ -77,36 +101,37 @@ def version_info(
         last commit: 1234567
         ```
     """
+    if format == 'json':
+        return dict(_collect_version_info())
+    return _format_version_info()
+
+
+@lru_cache(maxsize=1)
+def _collect_version_info() -> dict[str, Any]:
+    """Collect the version information of the Plateforme framework.
+
+    Note:
+        The information is collected once per process, as reading the
+        distributions metadata and querying the git repository is costly
+        and their result does not change while the framework is running.
+        Callers must not mutate the returned dictionary.
+    """
+    # Import lazily the modules only required to collect the information,
+    # the metadata module alone being slow to import at framework startup.
     import importlib.metadata
     import platform
     import sys
-    from pathlib import Path
 
     from .tools import git
 
-    # Get information about packages that are closely related to Plateforme,
-    # use Plateforme or often conflict with Plateforme framework.
-    package_names = {
-        'alembic',
-        'fastapi',
-        'mypy',
-        'pydantic',
-        'pydantic_core',
-        'pydantic-extra-types',
-        'pydantic-settings',
-        'pyright',
-        'sqlalchemy',
-        'starlette',
-        'typing_extensions',
-        'uvicorn',
-    }
-
     # Get information about related packages
     related_packages = []
-    for dist in importlib.metadata.distributions():
-        name = dist.metadata['Name'].lower()
-        if name in package_names:
-            related_packages.append(f'{name}-{dist.version}')
+    for name in _RELATED_PACKAGES:
+        try:
+            version = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+        related_packages.append(f'{name}-{version}')
     related_packages.sort()
 
     # Get information about the framework
@@ -125,12 +150,18 @@ def version_info(
         'related packages': ' '.join(related_packages),
         'last commit': most_recent_commit,
     }
-    if format == 'json':
-        return info
-    return '\n'.join(
-        '{:>18} {}'.format(key + ':', str(value).replace('\n', ' '))
-        for key, value in info.items()
-    )
+    return info
+
+
+@lru_cache(maxsize=1)
+def _format_version_info() -> str:
+    """Format the collected version information as aligned text lines."""
+    lines = []
+    for key, value in _collect_version_info().items():
+        label = f'{key}:'
+        text = str(value).replace('\n', ' ')
+        lines.append(f'{label:>18} {text}')
+    return '\n'.join(lines)
 
 
 def version_major() -> str:
@@ -142,7 +173,7 @@ def version_major() -> str:
     Examples:
         It returns ``2`` if Plateforme framework version is ``2.1.1``.
     """
-    return '.'.join(VERSION.split('.')[:1])
+    return _VERSION_MAJOR
 
 
 def version_minor() -> str:
@@ -154,7 +185,7 @@ def version_minor() -> str:
     Examples:
         It returns ``2.1`` if Plateforme framework version is ``2.1.1``.
     """
-    return '.'.join(VERSION.split('.')[:2])
+    return _VERSION_MINOR
 
 
 def version_patch() -> str:
@@ -166,12 +197,12 @@ def version_patch() -> str:
     Examples:
         It returns ``2.1.1`` if Plateforme framework version is ``2.1.1``.
     """
-    return '.'.join(VERSION.split('.')[:3])
+    return _VERSION_PATCH
 
 
 class URL(StrEnum):
     """An enumeration of URLs used within the Plateforme framework."""
 
-    DOCS = f'https://docs.plateforme.io/{version_minor()}'
-    ERRORS = f'https://docs.plateforme.io/{version_minor()}/errors'
+    DOCS = f'https://docs.plateforme.io/{_VERSION_MINOR}'
+    ERRORS = f'https://docs.plateforme.io/{_VERSION_MINOR}/errors'
     FAVICON = 'https://docs.plateforme.io/favicon.png'
@@ -11,6 +11,8 @@ This module provides logging utilities for the Plateforme framework.
 
 from .core.logging import (
     COLOR_MAP,
+    LOG_FORMATTER_MAP,
+    LOG_HANDLER_MAP,
     LOG_RECORD_MAP,
     Color,
     DefaultFormatter,
@@ -31,6 +33,8 @@ __all__ = (
     'StreamHandler',
     # Utilities
     'COLOR_MAP',
+    'LOG_FORMATTER_MAP',
+    'LOG_HANDLER_MAP',
     'LOG_RECORD_MAP',
     'Color',
 )
@@ -36,8 +36,12 @@ from .core.api.security import (
     OAuth2RevocationType,
     OAuth2TokenEndpointRequestForm,
     OAuth2TokenType,
+    OAuth2Type,
     OpenIdConnect,
     SecurityScopes,
+    get_request_form_dependant,
+    validate_authorize_request_form,
+    validate_token_request_form,
 )
 
 __all__ = (
@@ -73,6 +77,11 @@ __all__ = (
     'OAuth2ResponseType',
     'OAuth2RevocationType',
     'OAuth2TokenType',
+    'OAuth2Type',
+    # OAuth2 (validation)
+    'get_request_form_dependant',
+    'validate_authorize_request_form',
+    'validate_token_request_form',
     # Miscellaneous
     'OpenIdConnect',
     'SecurityScopes',